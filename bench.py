@@ -0,0 +1,208 @@
+# bench.py
+# Benchmark of the pair-analysis pipeline stages on synthetic price universes. Each stage is timed separately
+# with its throughput and peak traced memory, and results are appended to a JSONL file so runs of different
+# versions can be compared. Needs no credentials: bars are served through the ReplayKite data source.
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import main
+
+# Synthetic universes put this many instruments in each sector and pair them all within the sector
+SECTOR_SIZE = 10
+# Fixed end of the synthetic history so results do not depend on the day the benchmark runs
+END_DATE = datetime(2026, 1, 1)
+
+# Function to return the current git commit of the tree being benchmarked, if any
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Function to build a synthetic universe of at least n_pairs same-sector pairs over `years` of business days.
+# Every instrument loads on its sector's random-walk factor plus stationary noise, so pairs are cointegrated.
+def synthetic_universe(n_pairs, years, seed=0):
+    rng = np.random.default_rng(seed)
+    pairs_per_sector = SECTOR_SIZE * (SECTOR_SIZE - 1) // 2
+    n_sectors = -(-n_pairs // pairs_per_sector)
+    n_instruments = n_sectors * SECTOR_SIZE
+    dates = pd.bdate_range(end=END_DATE, periods=int(252 * years))
+    factors = np.cumsum(rng.normal(0, 1, (len(dates), n_sectors)), axis=0)
+    sector_of = np.repeat(np.arange(n_sectors), SECTOR_SIZE)
+    loadings = rng.uniform(0.5, 1.5, n_instruments)
+    noise = np.zeros((len(dates), n_instruments))
+    shocks = rng.normal(0, 1, noise.shape)
+    for t in range(1, len(dates)):
+        noise[t] = 0.9 * noise[t - 1] + shocks[t]
+    prices = 500 + loadings * factors[:, sector_of] * 5 + noise
+    registry = main.InstrumentRegistry(
+        np.arange(n_instruments) + 100000,
+        [f"SYN{i:05d}" for i in range(n_instruments)],
+        [f"Sector {s:03d}" for s in sector_of]
+    )
+    within = np.array([(i, j) for i in range(SECTOR_SIZE) for j in range(i + 1, SECTOR_SIZE)])
+    left = (np.arange(n_sectors)[:, None] * SECTOR_SIZE + within[None, :, 0]).ravel()[:n_pairs]
+    right = (np.arange(n_sectors)[:, None] * SECTOR_SIZE + within[None, :, 1]).ravel()[:n_pairs]
+    return registry, main.PairTable(left, right), dates, prices
+
+# Function to write synthetic bars in the RecordingKite layout so the fetch stage runs through ReplayKite
+def write_recording(directory, registry, dates, prices):
+    for i, token in enumerate(registry.tokens):
+        pd.DataFrame({"date": dates, "close": prices[:, i]}).to_parquet(
+            os.path.join(directory, f"{token}_day.parquet"), index=False
+        )
+    with open(os.path.join(directory, "manifest.json"), "w") as f:
+        json.dump({"recorded_until": END_DATE.isoformat(), "latency": {}}, f)
+
+# Stage timer: wall time and tracemalloc peak of each stage, plus the number of pairs it processed
+class StageTimer:
+    def __init__(self):
+        self.stages = []
+
+    def run(self, name, pairs, function, *args, **kwargs):
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - started
+        self.stages.append({
+            "stage": name,
+            "seconds": round(seconds, 4),
+            "pairs": pairs,
+            "pairs_per_sec": round(pairs / seconds, 1) if seconds > 0 else None,
+            "peak_mb": round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1),
+        })
+        return result
+
+# Function to run every pipeline stage once on a synthetic universe and return the stage measurements
+def benchmark(n_pairs, years, workers, render_pairs, work_dir):
+    registry, pairs, dates, prices = synthetic_universe(n_pairs, years)
+    recording_dir = os.path.join(work_dir, "recording")
+    save_dir = os.path.join(work_dir, "output")
+    os.makedirs(recording_dir)
+    os.makedirs(save_dir)
+    write_recording(recording_dir, registry, dates, prices)
+    main.clients["kite"] = main.ReplayKite(recording_dir)
+    timer = StageTimer()
+    panel = timer.run(
+        "fetch", len(pairs), main.fetch_price_panel, registry,
+        days=int(366 * years) + 7, cache_dir=None, as_of=END_DATE
+    )
+    panel, _ = timer.run(
+        "price_alignment", len(pairs), main.align_price_panel, panel, registry, main.load_corporate_actions(None, registry)
+    )
+    panel.save(save_dir)
+    panel = timer.run("panel_mmap", len(pairs), main.PricePanel.load, save_dir)
+    prices = panel.prices
+    x, y = timer.run("align", len(pairs), lambda: (prices[:, pairs.left], prices[:, pairs.right]))
+    regression = timer.run("ols", len(pairs), main.batch_ols, x, y)
+    residuals = regression["residuals"]
+    adf = timer.run(
+        "adf", len(pairs), main.batch_adfuller,
+        [residuals[:, j][~np.isnan(residuals[:, j])] for j in range(len(pairs))]
+    )
+    timer.run("rolling_ols", len(pairs), main.chunked_rolling_ols, prices, pairs.left, pairs.right, 60)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        deviation = residuals / regression["std_error"]
+    tasks = main.build_pair_tasks(registry, pairs, regression, adf)
+    timer.run("analyze", len(pairs), main.run_pair_stage, main.analyze_pair, tasks, panel, deviation, save_dir, workers)
+    paths = timer.run(
+        "signal_store", len(pairs), main.write_signal_store, save_dir, END_DATE.strftime("%Y-%m-%d"),
+        panel.dates, deviation, regression["beta"], adf["p_value"], pairs, registry
+    )
+    sample = tasks[:render_pairs]
+    plot_paths = timer.run("render", len(sample), main.render_charts, sample, panel, deviation, save_dir, workers, "all")
+    # Drive itself needs credentials, so the upload stage measures the MD5 change check done before every upload
+    timer.run("upload_check", len(pairs), lambda: [main.file_md5(path) for path in paths + plot_paths])
+    return registry, timer.stages
+
+# Function to compare new records with the latest earlier record of the same size and stage from another commit
+def compare(records, history, threshold):
+    previous = {}
+    for record in history:
+        if record.get("commit") != records[0].get("commit"):
+            previous[(record["pairs_requested"], record["years"], record["stage"])] = record
+    regressions = []
+    for record in records:
+        baseline = previous.get((record["pairs_requested"], record["years"], record["stage"]))
+        if not baseline or not baseline["seconds"]:
+            continue
+        ratio = record["seconds"] / baseline["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{record['stage']} ({record['pairs_requested']} pairs, {record['years']}y): "
+                f"{baseline['seconds']:.3f}s at {baseline.get('commit')} -> {record['seconds']:.3f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+# Function to parse command line options
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pair-analysis pipeline stages on synthetic universes")
+    parser.add_argument("--pairs", type=main.float_list, default=[100, 1000],
+                        help="Comma-separated universe sizes in pairs, e.g. 100,1000,10000 (default: 100,1000)")
+    parser.add_argument("--years", type=main.float_list, default=[1],
+                        help="Comma-separated history lengths in years, e.g. 1,5,10 (default: 1)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for the analyze and render stages (default: 1)")
+    parser.add_argument("--render-pairs", type=int, default=20,
+                        help="Number of pairs whose charts are rendered (default: 20)")
+    parser.add_argument("--output", default="bench_results.jsonl",
+                        help="JSONL file the results are appended to (default: bench_results.jsonl)")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Slowdown versus the previous commit's results reported as a regression (default: 0.2)")
+    return parser.parse_args(argv)
+
+def main_bench(argv=None):
+    args = parse_args(argv)
+    # Keep per-pair log lines out of the timings
+    logging.getLogger().setLevel(logging.WARNING)
+    history = []
+    if os.path.exists(args.output):
+        with open(args.output) as f:
+            history = [json.loads(line) for line in f if line.strip()]
+    run = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "workers": args.workers,
+    }
+    records = []
+    # main imports statsmodels and matplotlib on first use; load them here so stage timings exclude import time
+    import statsmodels.tsa.adfvalues  # noqa: F401
+    main.get_chart_template()
+    tracemalloc.start()
+    for n_pairs in [int(n) for n in args.pairs]:
+        for years in args.years:
+            with tempfile.TemporaryDirectory() as work_dir:
+                registry, stages = benchmark(n_pairs, years, args.workers, args.render_pairs, work_dir)
+            for stage in stages:
+                records.append(dict(run, pairs_requested=n_pairs, years=years, instruments=len(registry), **stage))
+            print(f"\n{n_pairs} pairs, {len(registry)} instruments, {years:g} years")
+            print(pd.DataFrame(stages).to_string(index=False))
+    tracemalloc.stop()
+    with open(args.output, "a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    print(f"\nAppended {len(records)} results to {args.output}")
+    regressions = compare(records, history, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main_bench())
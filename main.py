@@ -1,1104 +1,1419 @@
 # main.py
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from kiteconnect import KiteConnect
+# Kite, Google, statsmodels, matplotlib and email modules are imported inside the functions that use them,
+# so commands that do not need them start without paying for the import
 import os
+import random
+import threading
+import time
 import pandas as pd
 import numpy as np
-import statsmodels.api as sm
 from datetime import datetime, timedelta
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from statsmodels.tsa.stattools import adfuller
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import argparse
+import hashlib
+import json
+import contextlib
+import cProfile
+import io
+import pstats
+import glob
+import re
+import shutil
+from urllib.parse import quote
 import logging
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email.mime.text import MIMEText
-from email import encoders
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Per-pair price and signal tables go to a separate debug dump, enabled with --debug-dump; while it is off
+# the tables are never rendered
+dump_logger = logging.getLogger(f"{__name__}.dump")
+dump_logger.propagate = False
+debug_dump = {"path": None}
+
+# Log argument whose text is only built when a handler formats the record, e.g. LazyText(lambda: df.to_string())
+class LazyText:
+    def __init__(self, render):
+        self.render = render
+
+    def __str__(self):
+        return self.render()
+
+# Function to send the per-pair debug tables of this process to `path`; also called in each pair worker
+def configure_debug_dump(path):
+    debug_dump["path"] = path
+    if path and not dump_logger.handlers:
+        handler = logging.FileHandler(path)
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(process)d - %(message)s'))
+        dump_logger.addHandler(handler)
+        dump_logger.setLevel(logging.DEBUG)
+
 # Google Drive setup
 SCOPES = ['https://www.googleapis.com/auth/drive']
-SERVICE_ACCOUNT_KEY = os.environ.get('GOOGLE_SERVICE_ACCOUNT_KEY')
-with open('/tmp/service-account.json', 'w') as f:
-    f.write(SERVICE_ACCOUNT_KEY)
-credentials = service_account.Credentials.from_service_account_file(
-    '/tmp/service-account.json', scopes=SCOPES)
-drive_service = build('drive', 'v3', credentials=credentials)
-
-# Zerodha Kite setup
-kite = KiteConnect(api_key=os.environ.get('KITE_API_KEY'))
-kite.set_access_token(os.environ.get('KITE_ACCESS_TOKEN'))
-
-# Define stock pairs with Zerodha instrument tokens
-stock_pairs = [
-  {'stock1': {'instrument_token': '589569', 'name': 'HAL', 'column': 'HAL_Close', 'sector': 'Aerospace & Defense'}, 'stock2': {'instrument_token': '98049', 'name': 'BEL', 'column': 'BEL_Close', 'sector': 'Aerospace & Defense'}},
-    {'stock1': {'instrument_token': '6191105', 'name': 'PIIND', 'column': 'PIIND_Close', 'sector': 'Agrochemicals'}, 'stock2': {'instrument_token': '2889473', 'name': 'UPL', 'column': 'UPL_Close', 'sector': 'Agrochemicals'}},
-    {'stock1': {'instrument_token': '1076225', 'name': 'MOTHERSON', 'column': 'MOTHERSON_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '558337', 'name': 'BOSCHLTD', 'column': 'BOSCHLTD_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '1076225', 'name': 'MOTHERSON', 'column': 'MOTHERSON_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '79873', 'name': 'TIINDIA', 'column': 'TIINDIA_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '1076225', 'name': 'MOTHERSON', 'column': 'MOTHERSON_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '108033', 'name': 'BHARATFORG', 'column': 'BHARATFORG_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '1076225', 'name': 'MOTHERSON', 'column': 'MOTHERSON_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '1199105', 'name': 'SONACOMS', 'column': 'SONACOMS_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '558337', 'name': 'BOSCHLTD', 'column': 'BOSCHLTD_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '79873', 'name': 'TIINDIA', 'column': 'TIINDIA_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '558337', 'name': 'BOSCHLTD', 'column': 'BOSCHLTD_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '108033', 'name': 'BHARATFORG', 'column': 'BHARATFORG_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '558337', 'name': 'BOSCHLTD', 'column': 'BOSCHLTD_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '1199105', 'name': 'SONACOMS', 'column': 'SONACOMS_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '79873', 'name': 'TIINDIA', 'column': 'TIINDIA_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '108033', 'name': 'BHARATFORG', 'column': 'BHARATFORG_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '79873', 'name': 'TIINDIA', 'column': 'TIINDIA_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '1199105', 'name': 'SONACOMS', 'column': 'SONACOMS_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '108033', 'name': 'BHARATFORG', 'column': 'BHARATFORG_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '1199105', 'name': 'SONACOMS', 'column': 'SONACOMS_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '1076225', 'name': 'MOTHERSON', 'column': 'MOTHERSON_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '173057', 'name': 'EXIDEIND', 'column': 'EXIDEIND_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '558337', 'name': 'BOSCHLTD', 'column': 'BOSCHLTD_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '173057', 'name': 'EXIDEIND', 'column': 'EXIDEIND_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '79873', 'name': 'TIINDIA', 'column': 'TIINDIA_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '173057', 'name': 'EXIDEIND', 'column': 'EXIDEIND_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '108033', 'name': 'BHARATFORG', 'column': 'BHARATFORG_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '173057', 'name': 'EXIDEIND', 'column': 'EXIDEIND_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '1199105', 'name': 'SONACOMS', 'column': 'SONACOMS_Close', 'sector': 'Auto Ancillaries'}, 'stock2': {'instrument_token': '173057', 'name': 'EXIDEIND', 'column': 'EXIDEIND_Close', 'sector': 'Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2815745', 'name': 'MARUTI', 'column': 'MARUTI_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '519937', 'name': 'M&M', 'column': 'M&M_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '884737', 'name': 'TATAMOTORS', 'column': 'TATAMOTORS_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '4267265', 'name': 'BAJAJ-AUTO', 'column': 'BAJAJ-AUTO_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '232961', 'name': 'EICHERMOT', 'column': 'EICHERMOT_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '2170625', 'name': 'TVSMOTOR', 'column': 'TVSMOTOR_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '345089', 'name': 'HEROMOTOCO', 'column': 'HEROMOTOCO_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '54273', 'name': 'ASHOKLEY', 'column': 'ASHOKLEY_Close', 'sector': 'Automobiles'}, 'stock2': {'instrument_token': '245249', 'name': 'ESCORTS', 'column': 'ESCORTS_Close', 'sector': 'Automobiles'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '341249', 'name': 'HDFCBANK', 'column': 'HDFCBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1270529', 'name': 'ICICIBANK', 'column': 'ICICIBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '779521', 'name': 'SBIN', 'column': 'SBIN_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '492033', 'name': 'KOTAKBANK', 'column': 'KOTAKBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1510401', 'name': 'AXISBANK', 'column': 'AXISBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1195009', 'name': 'BANKBARODA', 'column': 'BANKBARODA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2730497', 'name': 'PNB', 'column': 'PNB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2752769', 'name': 'UNIONBANK', 'column': 'UNIONBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2763265', 'name': 'CANBK', 'column': 'CANBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3663105', 'name': 'INDIANB', 'column': 'INDIANB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '3050241', 'name': 'YESBANK', 'column': 'YESBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1346049', 'name': 'INDUSINDBK', 'column': 'INDUSINDBK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '5436929', 'name': 'AUBANK', 'column': 'AUBANK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '1214721', 'name': 'BANKINDIA', 'column': 'BANKINDIA_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2863105', 'name': 'IDFCFIRSTB', 'column': 'IDFCFIRSTB_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '261889', 'name': 'FEDERALBNK', 'column': 'FEDERALBNK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '579329', 'name': 'BANDHANBNK', 'column': 'BANDHANBNK_Close', 'sector': 'Banking'}, 'stock2': {'instrument_token': '4708097', 'name': 'RBLBANK', 'column': 'RBLBANK_Close', 'sector': 'Banking'}},
-    {'stock1': {'instrument_token': '2674433', 'name': 'UNITDSPR', 'column': 'UNITDSPR_Close', 'sector': 'Beverages'}, 'stock2': {'instrument_token': '4278529', 'name': 'UBL', 'column': 'UBL_Close', 'sector': 'Beverages'}},
-    {'stock1': {'instrument_token': '2674433', 'name': 'UNITDSPR', 'column': 'UNITDSPR_Close', 'sector': 'Beverages'}, 'stock2': {'instrument_token': '4843777', 'name': 'VBL', 'column': 'VBL_Close', 'sector': 'Beverages'}},
-    {'stock1': {'instrument_token': '4278529', 'name': 'UBL', 'column': 'UBL_Close', 'sector': 'Beverages'}, 'stock2': {'instrument_token': '4843777', 'name': 'VBL', 'column': 'VBL_Close', 'sector': 'Beverages'}},
-    {'stock1': {'instrument_token': '2911489', 'name': 'BIOCON', 'column': 'BIOCON_Close', 'sector': 'Biotechnology'}, 'stock2': {'instrument_token': '2622209', 'name': 'SYNGENE', 'column': 'SYNGENE_Close', 'sector': 'Biotechnology'}},
-    {'stock1': {'instrument_token': '2952193', 'name': 'ULTRACEMCO', 'column': 'ULTRACEMCO_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '325121', 'name': 'AMBUJACEM', 'column': 'AMBUJACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2952193', 'name': 'ULTRACEMCO', 'column': 'ULTRACEMCO_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '794369', 'name': 'SHREECEM', 'column': 'SHREECEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2952193', 'name': 'ULTRACEMCO', 'column': 'ULTRACEMCO_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '3397121', 'name': 'JKCEMENT', 'column': 'JKCEMENT_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2952193', 'name': 'ULTRACEMCO', 'column': 'ULTRACEMCO_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '2067201', 'name': 'DALBHARAT', 'column': 'DALBHARAT_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2952193', 'name': 'ULTRACEMCO', 'column': 'ULTRACEMCO_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '5633', 'name': 'ACC', 'column': 'ACC_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2952193', 'name': 'ULTRACEMCO', 'column': 'ULTRACEMCO_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '523009', 'name': 'RAMCOCEM', 'column': 'RAMCOCEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2952193', 'name': 'ULTRACEMCO', 'column': 'ULTRACEMCO_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '387841', 'name': 'INDIACEM', 'column': 'INDIACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '325121', 'name': 'AMBUJACEM', 'column': 'AMBUJACEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '794369', 'name': 'SHREECEM', 'column': 'SHREECEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '325121', 'name': 'AMBUJACEM', 'column': 'AMBUJACEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '3397121', 'name': 'JKCEMENT', 'column': 'JKCEMENT_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '325121', 'name': 'AMBUJACEM', 'column': 'AMBUJACEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '2067201', 'name': 'DALBHARAT', 'column': 'DALBHARAT_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '325121', 'name': 'AMBUJACEM', 'column': 'AMBUJACEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '5633', 'name': 'ACC', 'column': 'ACC_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '325121', 'name': 'AMBUJACEM', 'column': 'AMBUJACEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '523009', 'name': 'RAMCOCEM', 'column': 'RAMCOCEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '325121', 'name': 'AMBUJACEM', 'column': 'AMBUJACEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '387841', 'name': 'INDIACEM', 'column': 'INDIACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '794369', 'name': 'SHREECEM', 'column': 'SHREECEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '3397121', 'name': 'JKCEMENT', 'column': 'JKCEMENT_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '794369', 'name': 'SHREECEM', 'column': 'SHREECEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '2067201', 'name': 'DALBHARAT', 'column': 'DALBHARAT_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '794369', 'name': 'SHREECEM', 'column': 'SHREECEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '5633', 'name': 'ACC', 'column': 'ACC_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '794369', 'name': 'SHREECEM', 'column': 'SHREECEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '523009', 'name': 'RAMCOCEM', 'column': 'RAMCOCEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '794369', 'name': 'SHREECEM', 'column': 'SHREECEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '387841', 'name': 'INDIACEM', 'column': 'INDIACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '3397121', 'name': 'JKCEMENT', 'column': 'JKCEMENT_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '2067201', 'name': 'DALBHARAT', 'column': 'DALBHARAT_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '3397121', 'name': 'JKCEMENT', 'column': 'JKCEMENT_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '5633', 'name': 'ACC', 'column': 'ACC_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '3397121', 'name': 'JKCEMENT', 'column': 'JKCEMENT_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '523009', 'name': 'RAMCOCEM', 'column': 'RAMCOCEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '3397121', 'name': 'JKCEMENT', 'column': 'JKCEMENT_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '387841', 'name': 'INDIACEM', 'column': 'INDIACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2067201', 'name': 'DALBHARAT', 'column': 'DALBHARAT_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '5633', 'name': 'ACC', 'column': 'ACC_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2067201', 'name': 'DALBHARAT', 'column': 'DALBHARAT_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '523009', 'name': 'RAMCOCEM', 'column': 'RAMCOCEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '2067201', 'name': 'DALBHARAT', 'column': 'DALBHARAT_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '387841', 'name': 'INDIACEM', 'column': 'INDIACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '5633', 'name': 'ACC', 'column': 'ACC_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '523009', 'name': 'RAMCOCEM', 'column': 'RAMCOCEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '5633', 'name': 'ACC', 'column': 'ACC_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '387841', 'name': 'INDIACEM', 'column': 'INDIACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '523009', 'name': 'RAMCOCEM', 'column': 'RAMCOCEM_Close', 'sector': 'Cement'}, 'stock2': {'instrument_token': '387841', 'name': 'INDIACEM', 'column': 'INDIACEM_Close', 'sector': 'Cement'}},
-    {'stock1': {'instrument_token': '681985', 'name': 'PIDILITIND', 'column': 'PIDILITIND_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '3412993', 'name': 'SOLARINDS', 'column': 'SOLARINDS_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '681985', 'name': 'PIDILITIND', 'column': 'PIDILITIND_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '837889', 'name': 'SRF', 'column': 'SRF_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '681985', 'name': 'PIDILITIND', 'column': 'PIDILITIND_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '5105409', 'name': 'DEEPAKNTR', 'column': 'DEEPAKNTR_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '681985', 'name': 'PIDILITIND', 'column': 'PIDILITIND_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '3756033', 'name': 'NAVINFLUOR', 'column': 'NAVINFLUOR_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '681985', 'name': 'PIDILITIND', 'column': 'PIDILITIND_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '871681', 'name': 'TATACHEM', 'column': 'TATACHEM_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '681985', 'name': 'PIDILITIND', 'column': 'PIDILITIND_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '67329', 'name': 'ATUL', 'column': 'ATUL_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '681985', 'name': 'PIDILITIND', 'column': 'PIDILITIND_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '1793', 'name': 'AARTIIND', 'column': 'AARTIIND_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3412993', 'name': 'SOLARINDS', 'column': 'SOLARINDS_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '837889', 'name': 'SRF', 'column': 'SRF_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3412993', 'name': 'SOLARINDS', 'column': 'SOLARINDS_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '5105409', 'name': 'DEEPAKNTR', 'column': 'DEEPAKNTR_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3412993', 'name': 'SOLARINDS', 'column': 'SOLARINDS_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '3756033', 'name': 'NAVINFLUOR', 'column': 'NAVINFLUOR_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3412993', 'name': 'SOLARINDS', 'column': 'SOLARINDS_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '871681', 'name': 'TATACHEM', 'column': 'TATACHEM_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3412993', 'name': 'SOLARINDS', 'column': 'SOLARINDS_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '67329', 'name': 'ATUL', 'column': 'ATUL_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3412993', 'name': 'SOLARINDS', 'column': 'SOLARINDS_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '1793', 'name': 'AARTIIND', 'column': 'AARTIIND_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '837889', 'name': 'SRF', 'column': 'SRF_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '5105409', 'name': 'DEEPAKNTR', 'column': 'DEEPAKNTR_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '837889', 'name': 'SRF', 'column': 'SRF_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '3756033', 'name': 'NAVINFLUOR', 'column': 'NAVINFLUOR_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '837889', 'name': 'SRF', 'column': 'SRF_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '871681', 'name': 'TATACHEM', 'column': 'TATACHEM_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '837889', 'name': 'SRF', 'column': 'SRF_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '67329', 'name': 'ATUL', 'column': 'ATUL_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '837889', 'name': 'SRF', 'column': 'SRF_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '1793', 'name': 'AARTIIND', 'column': 'AARTIIND_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '5105409', 'name': 'DEEPAKNTR', 'column': 'DEEPAKNTR_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '3756033', 'name': 'NAVINFLUOR', 'column': 'NAVINFLUOR_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '5105409', 'name': 'DEEPAKNTR', 'column': 'DEEPAKNTR_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '871681', 'name': 'TATACHEM', 'column': 'TATACHEM_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '5105409', 'name': 'DEEPAKNTR', 'column': 'DEEPAKNTR_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '67329', 'name': 'ATUL', 'column': 'ATUL_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '5105409', 'name': 'DEEPAKNTR', 'column': 'DEEPAKNTR_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '1793', 'name': 'AARTIIND', 'column': 'AARTIIND_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3756033', 'name': 'NAVINFLUOR', 'column': 'NAVINFLUOR_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '871681', 'name': 'TATACHEM', 'column': 'TATACHEM_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3756033', 'name': 'NAVINFLUOR', 'column': 'NAVINFLUOR_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '67329', 'name': 'ATUL', 'column': 'ATUL_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '3756033', 'name': 'NAVINFLUOR', 'column': 'NAVINFLUOR_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '1793', 'name': 'AARTIIND', 'column': 'AARTIIND_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '871681', 'name': 'TATACHEM', 'column': 'TATACHEM_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '67329', 'name': 'ATUL', 'column': 'ATUL_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '871681', 'name': 'TATACHEM', 'column': 'TATACHEM_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '1793', 'name': 'AARTIIND', 'column': 'AARTIIND_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '67329', 'name': 'ATUL', 'column': 'ATUL_Close', 'sector': 'Chemicals'}, 'stock2': {'instrument_token': '1793', 'name': 'AARTIIND', 'column': 'AARTIIND_Close', 'sector': 'Chemicals'}},
-    {'stock1': {'instrument_token': '738561', 'name': 'RELIANCE', 'column': 'RELIANCE_Close', 'sector': 'Conglomerate'}, 'stock2': {'instrument_token': '6401', 'name': 'ADANIENT', 'column': 'ADANIENT_Close', 'sector': 'Conglomerate'}},
-    {'stock1': {'instrument_token': '738561', 'name': 'RELIANCE', 'column': 'RELIANCE_Close', 'sector': 'Conglomerate'}, 'stock2': {'instrument_token': '315393', 'name': 'GRASIM', 'column': 'GRASIM_Close', 'sector': 'Conglomerate'}},
-    {'stock1': {'instrument_token': '6401', 'name': 'ADANIENT', 'column': 'ADANIENT_Close', 'sector': 'Conglomerate'}, 'stock2': {'instrument_token': '315393', 'name': 'GRASIM', 'column': 'GRASIM_Close', 'sector': 'Conglomerate'}},
-    {'stock1': {'instrument_token': '951809', 'name': 'VOLTAS', 'column': 'VOLTAS_Close', 'sector': 'Consumer Durables / Electrical'}, 'stock2': {'instrument_token': '4376065', 'name': 'CROMPTON', 'column': 'CROMPTON_Close', 'sector': 'Consumer Durables / Electrical'}},
-    {'stock1': {'instrument_token': '897537', 'name': 'TITAN', 'column': 'TITAN_Close', 'sector': 'Consumer Durables / Jewellery'}, 'stock2': {'instrument_token': '756481', 'name': 'KALYANKJIL', 'column': 'KALYANKJIL_Close', 'sector': 'Consumer Durables / Jewellery'}},
-    {'stock1': {'instrument_token': '1675521', 'name': 'NYKAA', 'column': 'NYKAA_Close', 'sector': 'E-Commerce'}, 'stock2': {'instrument_token': '2745857', 'name': 'INDIAMART', 'column': 'INDIAMART_Close', 'sector': 'E-Commerce'}},
-    {'stock1': {'instrument_token': '3329', 'name': 'ABB', 'column': 'ABB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '806401', 'name': 'SIEMENS', 'column': 'SIEMENS_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '3329', 'name': 'ABB', 'column': 'ABB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '2513665', 'name': 'HAVELLS', 'column': 'HAVELLS_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '3329', 'name': 'ABB', 'column': 'ABB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '194561', 'name': 'CGPOWER', 'column': 'CGPOWER_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '3329', 'name': 'ABB', 'column': 'ABB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '2455041', 'name': 'POLYCAB', 'column': 'POLYCAB_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '3329', 'name': 'ABB', 'column': 'ABB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '112129', 'name': 'BHEL', 'column': 'BHEL_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '3329', 'name': 'ABB', 'column': 'ABB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '3407361', 'name': 'KEI', 'column': 'KEI_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '806401', 'name': 'SIEMENS', 'column': 'SIEMENS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '2513665', 'name': 'HAVELLS', 'column': 'HAVELLS_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '806401', 'name': 'SIEMENS', 'column': 'SIEMENS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '194561', 'name': 'CGPOWER', 'column': 'CGPOWER_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '806401', 'name': 'SIEMENS', 'column': 'SIEMENS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '2455041', 'name': 'POLYCAB', 'column': 'POLYCAB_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '806401', 'name': 'SIEMENS', 'column': 'SIEMENS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '112129', 'name': 'BHEL', 'column': 'BHEL_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '806401', 'name': 'SIEMENS', 'column': 'SIEMENS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '3407361', 'name': 'KEI', 'column': 'KEI_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '2513665', 'name': 'HAVELLS', 'column': 'HAVELLS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '194561', 'name': 'CGPOWER', 'column': 'CGPOWER_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '2513665', 'name': 'HAVELLS', 'column': 'HAVELLS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '2455041', 'name': 'POLYCAB', 'column': 'POLYCAB_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '2513665', 'name': 'HAVELLS', 'column': 'HAVELLS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '112129', 'name': 'BHEL', 'column': 'BHEL_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '2513665', 'name': 'HAVELLS', 'column': 'HAVELLS_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '3407361', 'name': 'KEI', 'column': 'KEI_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '194561', 'name': 'CGPOWER', 'column': 'CGPOWER_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '2455041', 'name': 'POLYCAB', 'column': 'POLYCAB_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '194561', 'name': 'CGPOWER', 'column': 'CGPOWER_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '112129', 'name': 'BHEL', 'column': 'BHEL_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '194561', 'name': 'CGPOWER', 'column': 'CGPOWER_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '3407361', 'name': 'KEI', 'column': 'KEI_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '2455041', 'name': 'POLYCAB', 'column': 'POLYCAB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '112129', 'name': 'BHEL', 'column': 'BHEL_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '2455041', 'name': 'POLYCAB', 'column': 'POLYCAB_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '3407361', 'name': 'KEI', 'column': 'KEI_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '112129', 'name': 'BHEL', 'column': 'BHEL_Close', 'sector': 'Electrical Equipment'}, 'stock2': {'instrument_token': '3407361', 'name': 'KEI', 'column': 'KEI_Close', 'sector': 'Electrical Equipment'}},
-    {'stock1': {'instrument_token': '5013761', 'name': 'BSE', 'column': 'BSE_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '7982337', 'name': 'MCX', 'column': 'MCX_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '5013761', 'name': 'BSE', 'column': 'BSE_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '5420545', 'name': 'CDSL', 'column': 'CDSL_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '5013761', 'name': 'BSE', 'column': 'BSE_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '82945', 'name': 'ANGELONE', 'column': 'ANGELONE_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '5013761', 'name': 'BSE', 'column': 'BSE_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '87553', 'name': 'CAMS', 'column': 'CAMS_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '5013761', 'name': 'BSE', 'column': 'BSE_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '56321', 'name': 'IEX', 'column': 'IEX_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '7982337', 'name': 'MCX', 'column': 'MCX_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '5420545', 'name': 'CDSL', 'column': 'CDSL_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '7982337', 'name': 'MCX', 'column': 'MCX_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '82945', 'name': 'ANGELONE', 'column': 'ANGELONE_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '7982337', 'name': 'MCX', 'column': 'MCX_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '87553', 'name': 'CAMS', 'column': 'CAMS_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '7982337', 'name': 'MCX', 'column': 'MCX_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '56321', 'name': 'IEX', 'column': 'IEX_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '5420545', 'name': 'CDSL', 'column': 'CDSL_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '82945', 'name': 'ANGELONE', 'column': 'ANGELONE_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '5420545', 'name': 'CDSL', 'column': 'CDSL_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '87553', 'name': 'CAMS', 'column': 'CAMS_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '5420545', 'name': 'CDSL', 'column': 'CDSL_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '56321', 'name': 'IEX', 'column': 'IEX_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '82945', 'name': 'ANGELONE', 'column': 'ANGELONE_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '87553', 'name': 'CAMS', 'column': 'CAMS_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '82945', 'name': 'ANGELONE', 'column': 'ANGELONE_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '56321', 'name': 'IEX', 'column': 'IEX_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '87553', 'name': 'CAMS', 'column': 'CAMS_Close', 'sector': 'Financial Services'}, 'stock2': {'instrument_token': '56321', 'name': 'IEX', 'column': 'IEX_Close', 'sector': 'Financial Services'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '356865', 'name': 'HINDUNILVR', 'column': 'HINDUNILVR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '424961', 'name': 'ITC', 'column': 'ITC_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '4598529', 'name': 'NESTLEIND', 'column': 'NESTLEIND_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '140033', 'name': 'BRITANNIA', 'column': 'BRITANNIA_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '2585345', 'name': 'GODREJCP', 'column': 'GODREJCP_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '878593', 'name': 'TATACONSUM', 'column': 'TATACONSUM_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '1041153', 'name': 'MARICO', 'column': 'MARICO_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '197633', 'name': 'DABUR', 'column': 'DABUR_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '3876097', 'name': 'COLPAL', 'column': 'COLPAL_Close', 'sector': 'FMCG'}, 'stock2': {'instrument_token': '4359425', 'name': 'PATANJALI', 'column': 'PATANJALI_Close', 'sector': 'FMCG'}},
-    {'stock1': {'instrument_token': '5728513', 'name': 'MAXHEALTH', 'column': 'MAXHEALTH_Close', 'sector': 'Healthcare'}, 'stock2': {'instrument_token': '40193', 'name': 'APOLLOHOSP', 'column': 'APOLLOHOSP_Close', 'sector': 'Healthcare'}},
-    {'stock1': {'instrument_token': '5728513', 'name': 'MAXHEALTH', 'column': 'MAXHEALTH_Close', 'sector': 'Healthcare'}, 'stock2': {'instrument_token': '2983425', 'name': 'LALPATHLAB', 'column': 'LALPATHLAB_Close', 'sector': 'Healthcare'}},
-    {'stock1': {'instrument_token': '5728513', 'name': 'MAXHEALTH', 'column': 'MAXHEALTH_Close', 'sector': 'Healthcare'}, 'stock2': {'instrument_token': '2452737', 'name': 'METROPOLIS', 'column': 'METROPOLIS_Close', 'sector': 'Healthcare'}},
-    {'stock1': {'instrument_token': '40193', 'name': 'APOLLOHOSP', 'column': 'APOLLOHOSP_Close', 'sector': 'Healthcare'}, 'stock2': {'instrument_token': '2983425', 'name': 'LALPATHLAB', 'column': 'LALPATHLAB_Close', 'sector': 'Healthcare'}},
-    {'stock1': {'instrument_token': '40193', 'name': 'APOLLOHOSP', 'column': 'APOLLOHOSP_Close', 'sector': 'Healthcare'}, 'stock2': {'instrument_token': '2452737', 'name': 'METROPOLIS', 'column': 'METROPOLIS_Close', 'sector': 'Healthcare'}},
-    {'stock1': {'instrument_token': '2983425', 'name': 'LALPATHLAB', 'column': 'LALPATHLAB_Close', 'sector': 'Healthcare'}, 'stock2': {'instrument_token': '2452737', 'name': 'METROPOLIS', 'column': 'METROPOLIS_Close', 'sector': 'Healthcare'}},
-    {'stock1': {'instrument_token': '2939649', 'name': 'LT', 'column': 'LT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '3861249', 'name': 'ADANIPORTS', 'column': 'ADANIPORTS_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '2939649', 'name': 'LT', 'column': 'LT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '3463169', 'name': 'GMRAIRPORT', 'column': 'GMRAIRPORT_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '2939649', 'name': 'LT', 'column': 'LT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '3920129', 'name': 'IRB', 'column': 'IRB_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '2939649', 'name': 'LT', 'column': 'LT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '8042241', 'name': 'NBCC', 'column': 'NBCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '2939649', 'name': 'LT', 'column': 'LT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '593665', 'name': 'NCC', 'column': 'NCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3861249', 'name': 'ADANIPORTS', 'column': 'ADANIPORTS_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '3463169', 'name': 'GMRAIRPORT', 'column': 'GMRAIRPORT_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3861249', 'name': 'ADANIPORTS', 'column': 'ADANIPORTS_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '3920129', 'name': 'IRB', 'column': 'IRB_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3861249', 'name': 'ADANIPORTS', 'column': 'ADANIPORTS_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '8042241', 'name': 'NBCC', 'column': 'NBCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3861249', 'name': 'ADANIPORTS', 'column': 'ADANIPORTS_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '593665', 'name': 'NCC', 'column': 'NCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3463169', 'name': 'GMRAIRPORT', 'column': 'GMRAIRPORT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '3920129', 'name': 'IRB', 'column': 'IRB_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3463169', 'name': 'GMRAIRPORT', 'column': 'GMRAIRPORT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '8042241', 'name': 'NBCC', 'column': 'NBCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3463169', 'name': 'GMRAIRPORT', 'column': 'GMRAIRPORT_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '593665', 'name': 'NCC', 'column': 'NCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3920129', 'name': 'IRB', 'column': 'IRB_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '8042241', 'name': 'NBCC', 'column': 'NBCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '3920129', 'name': 'IRB', 'column': 'IRB_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '593665', 'name': 'NCC', 'column': 'NCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '8042241', 'name': 'NBCC', 'column': 'NBCC_Close', 'sector': 'Infrastructure'}, 'stock2': {'instrument_token': '593665', 'name': 'NCC', 'column': 'NCC_Close', 'sector': 'Infrastructure'}},
-    {'stock1': {'instrument_token': '2426881', 'name': 'LICI', 'column': 'LICI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '5582849', 'name': 'SBILIFE', 'column': 'SBILIFE_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '2426881', 'name': 'LICI', 'column': 'LICI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '119553', 'name': 'HDFCLIFE', 'column': 'HDFCLIFE_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '2426881', 'name': 'LICI', 'column': 'LICI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '5573121', 'name': 'ICICIGI', 'column': 'ICICIGI_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '2426881', 'name': 'LICI', 'column': 'LICI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '4774913', 'name': 'ICICIPRULI', 'column': 'ICICIPRULI_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '2426881', 'name': 'LICI', 'column': 'LICI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '548353', 'name': 'MFSL', 'column': 'MFSL_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '5582849', 'name': 'SBILIFE', 'column': 'SBILIFE_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '119553', 'name': 'HDFCLIFE', 'column': 'HDFCLIFE_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '5582849', 'name': 'SBILIFE', 'column': 'SBILIFE_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '5573121', 'name': 'ICICIGI', 'column': 'ICICIGI_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '5582849', 'name': 'SBILIFE', 'column': 'SBILIFE_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '4774913', 'name': 'ICICIPRULI', 'column': 'ICICIPRULI_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '5582849', 'name': 'SBILIFE', 'column': 'SBILIFE_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '548353', 'name': 'MFSL', 'column': 'MFSL_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '119553', 'name': 'HDFCLIFE', 'column': 'HDFCLIFE_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '5573121', 'name': 'ICICIGI', 'column': 'ICICIGI_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '119553', 'name': 'HDFCLIFE', 'column': 'HDFCLIFE_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '4774913', 'name': 'ICICIPRULI', 'column': 'ICICIPRULI_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '119553', 'name': 'HDFCLIFE', 'column': 'HDFCLIFE_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '548353', 'name': 'MFSL', 'column': 'MFSL_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '5573121', 'name': 'ICICIGI', 'column': 'ICICIGI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '4774913', 'name': 'ICICIPRULI', 'column': 'ICICIPRULI_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '5573121', 'name': 'ICICIGI', 'column': 'ICICIGI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '548353', 'name': 'MFSL', 'column': 'MFSL_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '4774913', 'name': 'ICICIPRULI', 'column': 'ICICIPRULI_Close', 'sector': 'Insurance'}, 'stock2': {'instrument_token': '548353', 'name': 'MFSL', 'column': 'MFSL_Close', 'sector': 'Insurance'}},
-    {'stock1': {'instrument_token': '3520257', 'name': 'NAUKRI', 'column': 'NAUKRI_Close', 'sector': 'Internet'}, 'stock2': {'instrument_token': '1703937', 'name': 'POLICYBZR', 'column': 'POLICYBZR_Close', 'sector': 'Internet'}},
-    {'stock1': {'instrument_token': '3520257', 'name': 'NAUKRI', 'column': 'NAUKRI_Close', 'sector': 'Internet'}, 'stock2': {'instrument_token': '1716481', 'name': 'PAYTM', 'column': 'PAYTM_Close', 'sector': 'Internet'}},
-    {'stock1': {'instrument_token': '1703937', 'name': 'POLICYBZR', 'column': 'POLICYBZR_Close', 'sector': 'Internet'}, 'stock2': {'instrument_token': '1716481', 'name': 'PAYTM', 'column': 'PAYTM_Close', 'sector': 'Internet'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2953217', 'name': 'TCS', 'column': 'TCS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '408065', 'name': 'INFY', 'column': 'INFY_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1850625', 'name': 'HCLTECH', 'column': 'HCLTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '969473', 'name': 'WIPRO', 'column': 'WIPRO_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '3465729', 'name': 'TECHM', 'column': 'TECHM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4561409', 'name': 'LTIM', 'column': 'LTIM_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4701441', 'name': 'PERSISTENT', 'column': 'PERSISTENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2748929', 'name': 'OFSS', 'column': 'OFSS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2955009', 'name': 'COFORGE', 'column': 'COFORGE_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1152769', 'name': 'MPHASIS', 'column': 'MPHASIS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '4752385', 'name': 'LTTS', 'column': 'LTTS_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '873217', 'name': 'TATAELXSI', 'column': 'TATAELXSI_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '2478849', 'name': 'KPITTECH', 'column': 'KPITTECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '5195009', 'name': 'TATATECH', 'column': 'TATATECH_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1471489', 'name': 'CYIENT', 'column': 'CYIENT_Close', 'sector': 'IT Services'}, 'stock2': {'instrument_token': '1790465', 'name': 'BSOFT', 'column': 'BSOFT_Close', 'sector': 'IT Services'}},
-    {'stock1': {'instrument_token': '1215745', 'name': 'CONCOR', 'column': 'CONCOR_Close', 'sector': 'Logistics'}, 'stock2': {'instrument_token': '2457345', 'name': 'DELHIVERY', 'column': 'DELHIVERY_Close', 'sector': 'Logistics'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '5215745', 'name': 'COALINDIA', 'column': 'COALINDIA_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3001089', 'name': 'JSWSTEEL', 'column': 'JSWSTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '895745', 'name': 'TATASTEEL', 'column': 'TATASTEEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '364545', 'name': 'HINDZINC', 'column': 'HINDZINC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '784129', 'name': 'VEDL', 'column': 'VEDL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '348929', 'name': 'HINDALCO', 'column': 'HINDALCO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '1723649', 'name': 'JINDALSTEL', 'column': 'JINDALSTEL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '3924993', 'name': 'NMDC', 'column': 'NMDC_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '2876417', 'name': 'JSL', 'column': 'JSL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '758529', 'name': 'SAIL', 'column': 'SAIL_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '6599681', 'name': 'APLAPOLLO', 'column': 'APLAPOLLO_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '1629185', 'name': 'NATIONALUM', 'column': 'NATIONALUM_Close', 'sector': 'Metals'}, 'stock2': {'instrument_token': '4592385', 'name': 'HINDCOPPER', 'column': 'HINDCOPPER_Close', 'sector': 'Metals'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '81153', 'name': 'BAJFINANCE', 'column': 'BAJFINANCE_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4268801', 'name': 'BAJAJFINSV', 'column': 'BAJAJFINSV_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4644609', 'name': 'JIOFIN', 'column': 'JIOFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '519425', 'name': 'IRFC', 'column': 'IRFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3660545', 'name': 'PFC', 'column': 'PFC_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '175361', 'name': 'CHOLAFIN', 'column': 'CHOLAFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '1102337', 'name': 'SHRIRAMFIN', 'column': 'SHRIRAMFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3930881', 'name': 'RECLTD', 'column': 'RECLTD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6054401', 'name': 'MUTHOOTFIN', 'column': 'MUTHOOTFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4600577', 'name': 'SBICARD', 'column': 'SBICARD_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5533185', 'name': 'ABCAPITAL', 'column': 'ABCAPITAL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5186817', 'name': 'IREDA', 'column': 'IREDA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '5331201', 'name': 'HUDCO', 'column': 'HUDCO_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '6386689', 'name': 'LTF', 'column': 'LTF_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '511233', 'name': 'LICHSGFIN', 'column': 'LICHSGFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '3400961', 'name': 'M&MFIN', 'column': 'M&MFIN_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '2919169', 'name': 'POONAWALLA', 'column': 'POONAWALLA_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4840449', 'name': 'PNBHOUSING', 'column': 'PNBHOUSING_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '617473', 'name': 'PEL', 'column': 'PEL_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '4879617', 'name': 'MANAPPURAM', 'column': 'MANAPPURAM_Close', 'sector': 'NBFC'}, 'stock2': {'instrument_token': '3023105', 'name': 'IIFL', 'column': 'IIFL_Close', 'sector': 'NBFC'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '633601', 'name': 'ONGC', 'column': 'ONGC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '415745', 'name': 'IOC', 'column': 'IOC_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '134657', 'name': 'BPCL', 'column': 'BPCL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1207553', 'name': 'GAIL', 'column': 'GAIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '359937', 'name': 'HINDPETRO', 'column': 'HINDPETRO_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '1552897', 'name': 'ATGL', 'column': 'ATGL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '4464129', 'name': 'OIL', 'column': 'OIL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '2905857', 'name': 'PETRONET', 'column': 'PETRONET_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '2713345', 'name': 'GUJGASLTD', 'column': 'GUJGASLTD_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '2883073', 'name': 'IGL', 'column': 'IGL_Close', 'sector': 'Oil & Gas'}, 'stock2': {'instrument_token': '4488705', 'name': 'MGL', 'column': 'MGL_Close', 'sector': 'Oil & Gas'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '857857', 'name': 'SUNPHARMA', 'column': 'SUNPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2800641', 'name': 'DIVISLAB', 'column': 'DIVISLAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '177665', 'name': 'CIPLA', 'column': 'CIPLA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '900609', 'name': 'TORNTPHARM', 'column': 'TORNTPHARM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '225537', 'name': 'DRREDDY', 'column': 'DRREDDY_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2672641', 'name': 'LUPIN', 'column': 'LUPIN_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2029825', 'name': 'ZYDUSLIFE', 'column': 'ZYDUSLIFE_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '70401', 'name': 'AUROPHARMA', 'column': 'AUROPHARMA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '4583169', 'name': 'ABBOTINDIA', 'column': 'ABBOTINDIA_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '2995969', 'name': 'ALKEM', 'column': 'ALKEM_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '1895937', 'name': 'GLENMARK', 'column': 'GLENMARK_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '418049', 'name': 'IPCALAB', 'column': 'IPCALAB_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '4923905', 'name': 'LAURUSLABS', 'column': 'LAURUSLABS_Close', 'sector': 'Pharmaceuticals'}, 'stock2': {'instrument_token': '3039233', 'name': 'GRANULES', 'column': 'GRANULES_Close', 'sector': 'Pharmaceuticals'}},
-    {'stock1': {'instrument_token': '860929', 'name': 'SUPREMEIND', 'column': 'SUPREMEIND_Close', 'sector': 'Plastics'}, 'stock2': {'instrument_token': '3691009', 'name': 'ASTRAL', 'column': 'ASTRAL_Close', 'sector': 'Plastics'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4454401', 'name': 'NHPC', 'column': 'NHPC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4574465', 'name': 'JSWENERGY', 'column': 'JSWENERGY_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '3529217', 'name': 'TORNTPOWER', 'column': 'TORNTPOWER_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4834049', 'name': 'SJVN', 'column': 'SJVN_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2977281', 'name': 'NTPC', 'column': 'NTPC_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '160769', 'name': 'CESC', 'column': 'CESC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4454401', 'name': 'NHPC', 'column': 'NHPC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4574465', 'name': 'JSWENERGY', 'column': 'JSWENERGY_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '3529217', 'name': 'TORNTPOWER', 'column': 'TORNTPOWER_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4834049', 'name': 'SJVN', 'column': 'SJVN_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3834113', 'name': 'POWERGRID', 'column': 'POWERGRID_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '160769', 'name': 'CESC', 'column': 'CESC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4454401', 'name': 'NHPC', 'column': 'NHPC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4574465', 'name': 'JSWENERGY', 'column': 'JSWENERGY_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '3529217', 'name': 'TORNTPOWER', 'column': 'TORNTPOWER_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4834049', 'name': 'SJVN', 'column': 'SJVN_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '877057', 'name': 'TATAPOWER', 'column': 'TATAPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '160769', 'name': 'CESC', 'column': 'CESC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4454401', 'name': 'NHPC', 'column': 'NHPC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4574465', 'name': 'JSWENERGY', 'column': 'JSWENERGY_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '3529217', 'name': 'TORNTPOWER', 'column': 'TORNTPOWER_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4834049', 'name': 'SJVN', 'column': 'SJVN_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '2615553', 'name': 'ADANIENSOL', 'column': 'ADANIENSOL_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '160769', 'name': 'CESC', 'column': 'CESC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '4574465', 'name': 'JSWENERGY', 'column': 'JSWENERGY_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '3529217', 'name': 'TORNTPOWER', 'column': 'TORNTPOWER_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '4574465', 'name': 'JSWENERGY', 'column': 'JSWENERGY_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4834049', 'name': 'SJVN', 'column': 'SJVN_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '4574465', 'name': 'JSWENERGY', 'column': 'JSWENERGY_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '160769', 'name': 'CESC', 'column': 'CESC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3529217', 'name': 'TORNTPOWER', 'column': 'TORNTPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '4834049', 'name': 'SJVN', 'column': 'SJVN_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3529217', 'name': 'TORNTPOWER', 'column': 'TORNTPOWER_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '160769', 'name': 'CESC', 'column': 'CESC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '4834049', 'name': 'SJVN', 'column': 'SJVN_Close', 'sector': 'Power'}, 'stock2': {'instrument_token': '160769', 'name': 'CESC', 'column': 'CESC_Close', 'sector': 'Power'}},
-    {'stock1': {'instrument_token': '3484417', 'name': 'IRCTC', 'column': 'IRCTC_Close', 'sector': 'Railways'}, 'stock2': {'instrument_token': '3945985', 'name': 'TITAGARH', 'column': 'TITAGARH_Close', 'sector': 'Railways'}},
-    {'stock1': {'instrument_token': '3771393', 'name': 'DLF', 'column': 'DLF_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '824321', 'name': 'LODHA', 'column': 'LODHA_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '3771393', 'name': 'DLF', 'column': 'DLF_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '4576001', 'name': 'GODREJPROP', 'column': 'GODREJPROP_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '3771393', 'name': 'DLF', 'column': 'DLF_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '5197313', 'name': 'PRESTIGE', 'column': 'PRESTIGE_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '3771393', 'name': 'DLF', 'column': 'DLF_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '5181953', 'name': 'OBEROIRLTY', 'column': 'OBEROIRLTY_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '3771393', 'name': 'DLF', 'column': 'DLF_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '3725313', 'name': 'PHOENIXLTD', 'column': 'PHOENIXLTD_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '824321', 'name': 'LODHA', 'column': 'LODHA_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '4576001', 'name': 'GODREJPROP', 'column': 'GODREJPROP_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '824321', 'name': 'LODHA', 'column': 'LODHA_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '5197313', 'name': 'PRESTIGE', 'column': 'PRESTIGE_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '824321', 'name': 'LODHA', 'column': 'LODHA_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '5181953', 'name': 'OBEROIRLTY', 'column': 'OBEROIRLTY_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '824321', 'name': 'LODHA', 'column': 'LODHA_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '3725313', 'name': 'PHOENIXLTD', 'column': 'PHOENIXLTD_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '4576001', 'name': 'GODREJPROP', 'column': 'GODREJPROP_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '5197313', 'name': 'PRESTIGE', 'column': 'PRESTIGE_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '4576001', 'name': 'GODREJPROP', 'column': 'GODREJPROP_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '5181953', 'name': 'OBEROIRLTY', 'column': 'OBEROIRLTY_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '4576001', 'name': 'GODREJPROP', 'column': 'GODREJPROP_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '3725313', 'name': 'PHOENIXLTD', 'column': 'PHOENIXLTD_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '5197313', 'name': 'PRESTIGE', 'column': 'PRESTIGE_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '5181953', 'name': 'OBEROIRLTY', 'column': 'OBEROIRLTY_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '5197313', 'name': 'PRESTIGE', 'column': 'PRESTIGE_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '3725313', 'name': 'PHOENIXLTD', 'column': 'PHOENIXLTD_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '5181953', 'name': 'OBEROIRLTY', 'column': 'OBEROIRLTY_Close', 'sector': 'Real Estate'}, 'stock2': {'instrument_token': '3725313', 'name': 'PHOENIXLTD', 'column': 'PHOENIXLTD_Close', 'sector': 'Real Estate'}},
-    {'stock1': {'instrument_token': '912129', 'name': 'ADANIGREEN', 'column': 'ADANIGREEN_Close', 'sector': 'Renewable Energy'}, 'stock2': {'instrument_token': '2010113', 'name': 'INOXWIND', 'column': 'INOXWIND_Close', 'sector': 'Renewable Energy'}},
-    {'stock1': {'instrument_token': '5097729', 'name': 'DMART', 'column': 'DMART_Close', 'sector': 'Retail'}, 'stock2': {'instrument_token': '502785', 'name': 'TRENT', 'column': 'TRENT_Close', 'sector': 'Retail'}},
-    {'stock1': {'instrument_token': '5097729', 'name': 'DMART', 'column': 'DMART_Close', 'sector': 'Retail'}, 'stock2': {'instrument_token': '7707649', 'name': 'ABFRL', 'column': 'ABFRL_Close', 'sector': 'Retail'}},
-    {'stock1': {'instrument_token': '502785', 'name': 'TRENT', 'column': 'TRENT_Close', 'sector': 'Retail'}, 'stock2': {'instrument_token': '7707649', 'name': 'ABFRL', 'column': 'ABFRL_Close', 'sector': 'Retail'}},
-    {'stock1': {'instrument_token': '3689729', 'name': 'PAGEIND', 'column': 'PAGEIND_Close', 'sector': 'Retail'}, 'stock2': {'instrument_token': '5097729', 'name': 'DMART', 'column': 'DMART_Close', 'sector': 'Retail'}},
-    {'stock1': {'instrument_token': '3689729', 'name': 'PAGEIND', 'column': 'PAGEIND_Close', 'sector': 'Retail'}, 'stock2': {'instrument_token': '502785', 'name': 'TRENT', 'column': 'TRENT_Close', 'sector': 'Retail'}},
-    {'stock1': {'instrument_token': '3689729', 'name': 'PAGEIND', 'column': 'PAGEIND_Close', 'sector': 'Retail'}, 'stock2': {'instrument_token': '7707649', 'name': 'ABFRL', 'column': 'ABFRL_Close', 'sector': 'Retail'}},
-    {'stock1': {'instrument_token': '2714625', 'name': 'BHARTIARTL', 'column': 'BHARTIARTL_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '7458561', 'name': 'INDUSTOWER', 'column': 'INDUSTOWER_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '2714625', 'name': 'BHARTIARTL', 'column': 'BHARTIARTL_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '3677697', 'name': 'IDEA', 'column': 'IDEA_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '2714625', 'name': 'BHARTIARTL', 'column': 'BHARTIARTL_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '952577', 'name': 'TATACOMM', 'column': 'TATACOMM_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '2714625', 'name': 'BHARTIARTL', 'column': 'BHARTIARTL_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '5619457', 'name': 'HFCL', 'column': 'HFCL_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '7458561', 'name': 'INDUSTOWER', 'column': 'INDUSTOWER_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '3677697', 'name': 'IDEA', 'column': 'IDEA_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '7458561', 'name': 'INDUSTOWER', 'column': 'INDUSTOWER_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '952577', 'name': 'TATACOMM', 'column': 'TATACOMM_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '7458561', 'name': 'INDUSTOWER', 'column': 'INDUSTOWER_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '5619457', 'name': 'HFCL', 'column': 'HFCL_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '3677697', 'name': 'IDEA', 'column': 'IDEA_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '952577', 'name': 'TATACOMM', 'column': 'TATACOMM_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '3677697', 'name': 'IDEA', 'column': 'IDEA_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '5619457', 'name': 'HFCL', 'column': 'HFCL_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '952577', 'name': 'TATACOMM', 'column': 'TATACOMM_Close', 'sector': 'Telecommunications'}, 'stock2': {'instrument_token': '5619457', 'name': 'HFCL', 'column': 'HFCL_Close', 'sector': 'Telecommunications'}},
-    {'stock1': {'instrument_token': '582913', 'name': 'MRF', 'column': 'MRF_Close', 'sector': 'Tyres / Auto Ancillaries'}, 'stock2': {'instrument_token': '85761', 'name': 'BALKRISIND', 'column': 'BALKRISIND_Close', 'sector': 'Tyres / Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '582913', 'name': 'MRF', 'column': 'MRF_Close', 'sector': 'Tyres / Auto Ancillaries'}, 'stock2': {'instrument_token': '41729', 'name': 'APOLLOTYRE', 'column': 'APOLLOTYRE_Close', 'sector': 'Tyres / Auto Ancillaries'}},
-    {'stock1': {'instrument_token': '85761', 'name': 'BALKRISIND', 'column': 'BALKRISIND_Close', 'sector': 'Tyres / Auto Ancillaries'}, 'stock2': {'instrument_token': '41729', 'name': 'APOLLOTYRE', 'column': 'APOLLOTYRE_Close', 'sector': 'Tyres / Auto Ancillaries'}},
-]
-
-# Function to upload to Google Drive (overwrites existing files)
-def upload_to_drive(filename, filepath, folder_id):
-    query = f"name='{filename}' and '{folder_id}' in parents and trashed=false"
-    response = drive_service.files().list(q=query, fields='files(id, name)').execute()
-    files = response.get('files', [])
-    media = MediaFileUpload(filepath, mimetype='application/octet-stream')
-    if files:
-        file_id = files[0]['id']
-        file = drive_service.files().update(fileId=file_id, media_body=media).execute()
-        logger.info(f"Updated existing file {filename} in Google Drive with ID: {file.get('id')}")
-    else:
-        file_metadata = {'name': filename, 'parents': [folder_id]}
-        file = drive_service.files().create(body=file_metadata, media_body=media, fields='id').execute()
-        logger.info(f"Created new file {filename} in Google Drive with ID: {file.get('id')}")
+DRIVE_UPLOAD_WORKERS = int(os.environ.get('DRIVE_UPLOAD_WORKERS', '8'))
+
+# Drive and Kite clients are built on first use, so offline (replay) runs need no credentials
+clients = {}
+clients_lock = threading.Lock()
+
+# Function to return the Drive service account credentials and service, building them on first use
+def get_drive_service():
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+    with clients_lock:
+        if "drive" not in clients:
+            with open('/tmp/service-account.json', 'w') as f:
+                f.write(os.environ.get('GOOGLE_SERVICE_ACCOUNT_KEY'))
+            credentials = service_account.Credentials.from_service_account_file(
+                '/tmp/service-account.json', scopes=SCOPES)
+            clients["drive"] = (credentials, build('drive', 'v3', credentials=credentials))
+        return clients["drive"]
+
+# Function to return the Zerodha Kite client, building it on first use
+def get_kite():
+    from kiteconnect import KiteConnect
+    with clients_lock:
+        if "kite" not in clients:
+            kite = KiteConnect(api_key=os.environ.get('KITE_API_KEY'))
+            kite.set_access_token(os.environ.get('KITE_ACCESS_TOKEN'))
+            clients["kite"] = kite
+        return clients["kite"]
+
+# Local OHLC cache setup (one Parquet file per instrument and interval)
+OHLC_CACHE_DIR = os.environ.get('OHLC_CACHE_DIR', '/tmp/ohlc_cache')
+OHLC_CACHE_REFRESH = os.environ.get('OHLC_CACHE_REFRESH', '').lower() in ('1', 'true', 'yes')
+
+# Kite historical API allows about 3 requests per second
+KITE_HISTORICAL_RATE = float(os.environ.get('KITE_HISTORICAL_RATE', '3'))
+FETCH_WORKERS = int(os.environ.get('FETCH_WORKERS', '8'))
+FETCH_MAX_RETRIES = 5
+
+# Longest date range Kite serves in one historical request, per interval; longer windows are fetched in chunks
+KITE_MAX_DAYS_PER_REQUEST = {
+    "minute": 60, "3minute": 100, "5minute": 100, "10minute": 100,
+    "15minute": 200, "30minute": 200, "60minute": 400, "day": 2000,
+}
+# Bars per NSE session (09:15-15:30), used to annualise intraday backtest returns
+BARS_PER_DAY = {
+    "minute": 375, "3minute": 125, "5minute": 75, "10minute": 38,
+    "15minute": 25, "30minute": 13, "60minute": 7, "day": 1,
+}
+
+# Rows of the panel fed through the rolling regression at a time, so intraday panels are not expanded into
+# every intermediate (bars x pairs) array at once
+ROLLING_CHUNK_ROWS = int(os.environ.get('ROLLING_CHUNK_ROWS', '2048'))
+# Working memory for the arrays of one batch of pairs in the static fit, ADF test and Kalman filter; pairs are
+# processed in batches sized to it and their (bars x pairs) results are written to memory-mapped files
+PAIR_BATCH_BYTES = int(os.environ.get('PAIR_BATCH_BYTES', str(256 * 2 ** 20)))
+
+# Deviation (in standard errors) beyond which a pair is flagged with a signal
+SIGNAL_THRESHOLD = 1.5
+
+# Instrument universe: instruments.csv (instrument_token, name, sector) and pairs.csv (stock1, stock2 by name),
+# compiled once into universe.npz next to them and reloaded from there while the sources are unchanged
+UNIVERSE_DIR = os.environ.get('UNIVERSE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'universe'))
+
+# Close-to-close move, as a fraction of the previous close, beyond which a bar is treated as a price
+# discontinuity (typically a split or bonus missing from corporate_actions.csv in the universe directory)
+PRICE_JUMP_THRESHOLD = float(os.environ.get('PRICE_JUMP_THRESHOLD', '0.3'))
+
+# ADF lag selection: AIC search like statsmodels adfuller, or a fixed lag when ADF_FIXED_LAG is set
+ADF_FIXED_LAG = os.environ.get('ADF_FIXED_LAG')
+
+# Token bucket shared by all fetch threads so concurrent requests stay under the API limit
+class RateLimiter:
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+historical_limiter = RateLimiter(KITE_HISTORICAL_RATE)
+fetch_metrics = {'requests': 0, 'retries': 0, 'failures': 0, 'durations': []}
+fetch_metrics_lock = threading.Lock()
+
+# Stage timings and counters of one run, saved as run_report.json and in Prometheus text format (run_metrics.prom)
+class RunMetrics:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = time.time()
+        self.stages = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            logger.info(f"Stage {name} took {elapsed:.2f}s")
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self, **extra):
+        with self.lock:
+            return {
+                "started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+                "total_seconds": round(time.time() - self.started, 3),
+                "stages": {name: round(seconds, 3) for name, seconds in self.stages.items()},
+                "counters": dict(self.counters),
+                **extra,
+            }
+
+    def prometheus(self, report):
+        lines = [
+            "# HELP pair_trading_run_seconds Wall time of the last run",
+            "# TYPE pair_trading_run_seconds gauge",
+            f"pair_trading_run_seconds {report['total_seconds']}",
+            "# HELP pair_trading_last_run_timestamp_seconds Start time of the last run",
+            "# TYPE pair_trading_last_run_timestamp_seconds gauge",
+            f"pair_trading_last_run_timestamp_seconds {self.started:.0f}",
+            "# HELP pair_trading_stage_seconds Wall time of each pipeline stage in the last run",
+            "# TYPE pair_trading_stage_seconds gauge",
+        ]
+        lines += [f'pair_trading_stage_seconds{{stage="{name}"}} {seconds}' for name, seconds in report["stages"].items()]
+        for name, value in sorted(report["counters"].items()):
+            lines += [f"# TYPE pair_trading_{name} gauge", f"pair_trading_{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self, save_dir, **extra):
+        report = self.report(**extra)
+        report_path = os.path.join(save_dir, "run_report.json")
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        with open(os.path.join(save_dir, "run_metrics.prom"), "w") as f:
+            f.write(self.prometheus(report))
+        logger.info(f"Run report saved to {report_path}: {report['stages']}")
+        return report
+
+run_metrics = RunMetrics()
+
+# Function to start the profiler requested for a run: cProfile, or pyinstrument's sampling profiler when installed
+def start_profiler(kind):
+    if kind == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument is not installed, profiling with cProfile instead")
+            kind = "cprofile"
+        else:
+            profiler = Profiler()
+            profiler.start()
+            return kind, profiler
+    if kind == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return kind, profiler
+    return None, None
+
+# Function to stop the profiler and save its output (profile.pstats or profile.html) in save_dir
+def stop_profiler(profiler, save_dir):
+    kind, profiler = profiler
+    if kind == "cprofile":
+        profiler.disable()
+        path = os.path.join(save_dir, "profile.pstats")
+        profiler.dump_stats(path)
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(25)
+        logger.info(f"Profile saved to {path}, top functions by cumulative time:\n{stream.getvalue()}")
+    elif kind == "pyinstrument":
+        profiler.stop()
+        path = os.path.join(save_dir, "profile.html")
+        with open(path, "w") as f:
+            f.write(profiler.output_html())
+        logger.info(f"Profile saved to {path}:\n{profiler.output_text()}")
+
+# Function to compute the MD5 of a local file the same way Drive reports md5Checksum
+def file_md5(filepath):
+    digest = hashlib.md5()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Uploads files into one Google Drive folder (overwriting same-named files). The folder is listed once into a
+# name -> file index, uploads run on a bounded thread pool and files whose MD5 matches the remote copy are skipped.
+# Drive's batch endpoint does not accept media uploads, so each changed file is still its own request.
+class DriveUploader:
+    def __init__(self, service, folder_id, workers=DRIVE_UPLOAD_WORKERS, http_factory=None):
+        self.service = service
+        self.folder_id = folder_id
+        self.workers = workers
+        # googleapiclient's default transport is not thread-safe, so each thread gets its own http object
+        self.http_factory = http_factory
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.index = None
+        self.stats = {'uploaded': 0, 'skipped': 0, 'failed': 0, 'bytes': 0}
+
+    def execute(self, request):
+        if self.http_factory is None:
+            return request.execute()
+        if not hasattr(self.local, 'http'):
+            self.local.http = self.http_factory()
+        return request.execute(http=self.local.http)
+
+    def load_index(self):
+        index = {}
+        page_token = None
+        query = f"'{self.folder_id}' in parents and trashed=false"
+        while True:
+            response = self.execute(self.service.files().list(
+                q=query, fields='nextPageToken, files(id, name, md5Checksum)', pageSize=1000, pageToken=page_token
+            ))
+            for file in response.get('files', []):
+                index.setdefault(file['name'], file)
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        self.index = index
+        logger.info(f"Indexed {len(index)} existing files in Google Drive folder {self.folder_id}")
+
+    def upload(self, filepath, filename=None):
+        filename = filename or os.path.basename(filepath)
+        if self.index is None:
+            self.load_index()
+        remote = self.index.get(filename)
+        md5 = file_md5(filepath)
+        if remote and remote.get('md5Checksum') == md5:
+            with self.lock:
+                self.stats['skipped'] += 1
+            logger.debug(f"Skipped unchanged file {filename}")
+            return remote['id']
+        from googleapiclient.http import MediaFileUpload
+        media = MediaFileUpload(filepath, mimetype='application/octet-stream')
+        try:
+            if remote:
+                file = self.execute(self.service.files().update(
+                    fileId=remote['id'], media_body=media, fields='id, md5Checksum'
+                ))
+                logger.info(f"Updated existing file {filename} in Google Drive with ID: {file.get('id')}")
+            else:
+                file_metadata = {'name': filename, 'parents': [self.folder_id]}
+                file = self.execute(self.service.files().create(
+                    body=file_metadata, media_body=media, fields='id, md5Checksum'
+                ))
+                logger.info(f"Created new file {filename} in Google Drive with ID: {file.get('id')}")
+        except Exception as e:
+            with self.lock:
+                self.stats['failed'] += 1
+            logger.error(f"Failed to upload {filename} to Google Drive: {e}")
+            return None
+        with self.lock:
+            self.index[filename] = {'id': file.get('id'), 'name': filename, 'md5Checksum': file.get('md5Checksum', md5)}
+            self.stats['uploaded'] += 1
+            self.stats['bytes'] += os.path.getsize(filepath)
+        return file.get('id')
+
+    def upload_many(self, filepaths):
+        if self.index is None:
+            self.load_index()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            file_ids = list(executor.map(self.upload, filepaths))
+        for name, key in (("files_uploaded", "uploaded"), ("files_unchanged", "skipped"),
+                          ("upload_failures", "failed"), ("bytes_uploaded", "bytes")):
+            run_metrics.count(name, self.stats[key])
+        logger.info(
+            f"Google Drive upload: {self.stats['uploaded']} uploaded ({self.stats['bytes'] / 1e6:.1f} MB), "
+            f"{self.stats['skipped']} unchanged, {self.stats['failed']} failed"
+        )
+        return file_ids
+
+# Function to create the uploader for the results folder, with one authorized http object per upload thread
+def get_drive_uploader(folder_id):
+    import google_auth_httplib2
+    import httplib2
+    credentials, drive_service = get_drive_service()
+    return DriveUploader(
+        drive_service, folder_id,
+        http_factory=lambda: google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+    )
+
+# Kite wrapper that records every historical_data response into `directory`: the bars merged into one Parquet file
+# per instrument and interval, plus manifest.json with the last request time and the latency of each file's requests
+class RecordingKite:
+    def __init__(self, client, directory):
+        self.client = client
+        self.directory = directory
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self.manifest = {"recorded_until": None, "latency": {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+
+    def historical_data(self, instrument_token, from_date, to_date, interval, continuous=False, oi=False):
+        started = time.perf_counter()
+        data = self.client.historical_data(instrument_token, from_date, to_date, interval, continuous=continuous, oi=oi)
+        latency = time.perf_counter() - started
+        key = f"{instrument_token}_{interval}"
+        with self.lock:
+            if data:
+                bars = pd.DataFrame(data)
+                bars['date'] = pd.to_datetime(bars['date'])
+                if bars['date'].dt.tz is not None:
+                    bars['date'] = bars['date'].dt.tz_localize(None)
+                path = os.path.join(self.directory, f"{key}.parquet")
+                if os.path.exists(path):
+                    bars = pd.concat([pd.read_parquet(path), bars], ignore_index=True)
+                bars = bars.drop_duplicates('date', keep='last').sort_values('date', ignore_index=True)
+                bars.to_parquet(path, index=False)
+            self.manifest["latency"][key] = latency
+            self.manifest["recorded_until"] = max(filter(None, [self.manifest["recorded_until"], str(to_date)]))
+            with open(self.manifest_path, "w") as f:
+                json.dump(self.manifest, f, indent=2)
+        return data
+
+# Kite stand-in serving historical_data from a RecordingKite directory, for deterministic runs without credentials.
+# With speed > 0 every request takes its recorded latency divided by speed; 0 answers as fast as possible.
+class ReplayKite:
+    # Replayed requests are local reads, so they skip the historical API rate limiter
+    rate_limited = False
 
-# Function to fetch OHLC data from Zerodha Kite API
-def fetch_ohlc(instrument_token, stock_name, column_name, exchange="NSE", interval="day", days=367):
+    def __init__(self, directory, speed=0.0):
+        self.directory = directory
+        self.speed = speed
+        with open(os.path.join(directory, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        self.recorded_until = datetime.fromisoformat(self.manifest["recorded_until"])
+        self.bars = {}
+        self.lock = threading.Lock()
+
+    def load(self, key):
+        with self.lock:
+            if key not in self.bars:
+                path = os.path.join(self.directory, f"{key}.parquet")
+                self.bars[key] = pd.read_parquet(path) if os.path.exists(path) else None
+            return self.bars[key]
+
+    def historical_data(self, instrument_token, from_date, to_date, interval, continuous=False, oi=False):
+        started = time.perf_counter()
+        key = f"{instrument_token}_{interval}"
+        bars = self.load(key)
+        data = []
+        if bars is not None:
+            selected = bars[(bars['date'] >= pd.Timestamp(from_date)) & (bars['date'] <= pd.Timestamp(to_date))]
+            data = selected.to_dict('records')
+        if self.speed > 0:
+            time.sleep(max(0.0, self.manifest["latency"].get(key, 0.0) / self.speed - (time.perf_counter() - started)))
+        return data
+
+# Function to call kite.historical_data under the rate limit, retrying throttled or failed requests with backoff
+def kite_historical_data(**params):
+    import requests
+    from kiteconnect import exceptions as kite_exceptions
+    delay = 1.0
+    kite = get_kite()
+    for attempt in range(1, FETCH_MAX_RETRIES + 1):
+        if getattr(kite, "rate_limited", True):
+            historical_limiter.acquire()
+        started = time.perf_counter()
+        try:
+            data = kite.historical_data(**params)
+        except (kite_exceptions.NetworkException, requests.exceptions.RequestException) as e:
+            with fetch_metrics_lock:
+                fetch_metrics['requests'] += 1
+                fetch_metrics['durations'].append(time.perf_counter() - started)
+                if attempt == FETCH_MAX_RETRIES:
+                    fetch_metrics['failures'] += 1
+                else:
+                    fetch_metrics['retries'] += 1
+            if attempt == FETCH_MAX_RETRIES:
+                raise
+            logger.warning(f"Request for instrument_token {params['instrument_token']} failed (attempt {attempt}): {e}, retrying in {delay:.1f}s")
+            time.sleep(delay + random.uniform(0, delay / 2))
+            delay *= 2
+            continue
+        with fetch_metrics_lock:
+            fetch_metrics['requests'] += 1
+            fetch_metrics['durations'].append(time.perf_counter() - started)
+        return data
+
+# Function to log request count, retries and latency of the historical data fetches
+def log_fetch_metrics(elapsed):
+    with fetch_metrics_lock:
+        durations = np.array(fetch_metrics['durations'])
+        requests_made = fetch_metrics['requests']
+        retries = fetch_metrics['retries']
+        failures = fetch_metrics['failures']
+    if not requests_made:
+        return
+    logger.info(
+        f"Fetch metrics: {requests_made} requests ({retries} retries, {failures} failures) in {elapsed:.1f}s "
+        f"({requests_made / elapsed:.2f} req/s), latency mean {durations.mean() * 1000:.0f}ms, "
+        f"p95 {np.percentile(durations, 95) * 1000:.0f}ms, max {durations.max() * 1000:.0f}ms"
+    )
+
+# Function to load cached OHLC bars, discarding files that fail validation
+def load_cached_ohlc(cache_path):
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        cached = pd.read_parquet(cache_path)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable cache file {cache_path}: {e}")
+        return None
+    if (list(cached.columns) != ['date', 'close'] or cached.empty
+            or not pd.api.types.is_datetime64_any_dtype(cached['date'])
+            or cached['date'].duplicated().any() or not cached['date'].is_monotonic_increasing
+            or cached['close'].isna().any()):
+        logger.warning(f"Discarding invalid cache file {cache_path}")
+        return None
+    return cached
+
+# Function to split a historical request into consecutive ranges no longer than Kite allows for the interval
+def historical_chunks(start, end, interval):
+    span = timedelta(days=KITE_MAX_DAYS_PER_REQUEST[interval])
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + span, end)
+        chunks.append((start, chunk_end))
+        start = chunk_end + timedelta(seconds=1)
+    return chunks
+
+# Function to fetch OHLC data from Zerodha Kite API, only requesting bars missing from the local cache
+# With cache_dir=None the cache is neither read nor written; as_of fixes the end of the window instead of now
+def fetch_ohlc(instrument_token, stock_name, column_name, exchange="NSE", interval="day", days=367, refresh=OHLC_CACHE_REFRESH,
+               cache_dir=OHLC_CACHE_DIR, as_of=None):
+    import requests
+    from kiteconnect import exceptions as kite_exceptions
     try:
-        to_date = datetime.now().date()
+        now = (as_of or datetime.now()).replace(microsecond=0)
+        to_date = now.date()
         from_date = to_date - timedelta(days=days)
-        # Fetch historical data
-        data = kite.historical_data(
-            instrument_token=instrument_token,
-            from_date=from_date.strftime('%Y-%m-%d'),
-            to_date=to_date.strftime('%Y-%m-%d'),
-            interval=interval,
-            continuous=False,
-            oi=False
-        )
-        if not data:
+        cache_path = cache_dir and os.path.join(cache_dir, f"{instrument_token}_{interval}.parquet")
+        cached = None if refresh or not cache_dir else load_cached_ohlc(cache_path)
+        if cached is not None and cached['date'].iloc[0].date() > from_date + timedelta(days=7):
+            logger.info(f"Cache for {stock_name} does not cover the requested window, refetching")
+            cached = None
+        # The last cached bar is fetched again since it may have been written before the bar closed
+        fetch_from = datetime.combine(from_date, datetime.min.time()) if cached is None else cached['date'].iloc[-1].to_pydatetime()
+        # Fetch historical data, one request per allowed range
+        data = []
+        try:
+            for chunk_from, chunk_to in historical_chunks(fetch_from, now, interval):
+                data += kite_historical_data(
+                    instrument_token=instrument_token,
+                    from_date=chunk_from.strftime('%Y-%m-%d %H:%M:%S'),
+                    to_date=chunk_to.strftime('%Y-%m-%d %H:%M:%S'),
+                    interval=interval,
+                    continuous=False,
+                    oi=False
+                ) or []
+        except (kite_exceptions.NetworkException, requests.exceptions.RequestException) as e:
+            if cached is None:
+                raise
+            # Network failures that outlasted the retries fall back to the cache, which still covers the window up
+            # to its last bar; anything else (e.g. an expired token) drops the instrument instead of serving stale bars
+            logger.warning(f"Incremental fetch for {stock_name} failed ({e}), using cached bars up to {cached['date'].iloc[-1]}")
+            data = None
+        if data:
+            fresh = pd.DataFrame(data)[['date', 'close']]
+            fresh['date'] = pd.to_datetime(fresh['date'])
+            if fresh['date'].dt.tz is not None:
+                fresh['date'] = fresh['date'].dt.tz_localize(None)
+            fresh = fresh.drop_duplicates('date', keep='last').sort_values('date', ignore_index=True)
+            if cached is not None:
+                fresh = pd.concat([cached[cached['date'] < fresh['date'].iloc[0]], fresh], ignore_index=True)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+                fresh.to_parquet(cache_path, index=False)
+            cached = fresh
+        if cached is None:
             logger.warning(f"No data returned for {stock_name} (instrument_token: {instrument_token})")
             return None
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        # Convert to DataFrame, keeping the dates as datetime64 values
+        df = cached[cached['date'] >= pd.Timestamp(from_date)]
         df = df[['date', 'close']].rename(columns={'date': 'Date', 'close': column_name})
-        df['Date'] = pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d')
-        logger.info(f"Fetched {len(df)} rows for {stock_name} from {df['Date'].min()} to {df['Date'].max()}")
+        df.attrs["stale"] = data is None
+        logger.info(f"Fetched {len(data or [])} new rows for {stock_name}, {len(df)} rows from {df['Date'].min()} to {df['Date'].max()}")
         return df
     except Exception as e:
         logger.error(f"Error fetching data for {stock_name} (instrument_token: {instrument_token}): {e}")
         return None
 
+# Instruments of the universe stored column-wise in arrays; everything else refers to an instrument by its row index
+class InstrumentRegistry:
+    def __init__(self, tokens, names, sectors):
+        self.tokens = np.asarray(tokens, dtype=np.int64)
+        self.names = np.asarray(names, dtype=object)
+        self.sector_names, sector_codes = np.unique(np.asarray(sectors, dtype=object), return_inverse=True)
+        self.sector_codes = sector_codes.astype(np.int16)
+        self.columns = [f"{name}_Close" for name in self.names]
+        self.positions = {int(token): i for i, token in enumerate(self.tokens)}
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def sectors(self, indices):
+        return self.sector_names[self.sector_codes[indices]]
+
+# Pairs stored as two int32 index arrays into an InstrumentRegistry; stock1 (left) is the x leg, stock2 (right) the y leg
+class PairTable:
+    def __init__(self, left, right):
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.left)
+
+    def subset(self, selection):
+        return PairTable(self.left[selection], self.right[selection])
+
+# Function to read and validate the universe source files into the arrays of a registry and pair table
+def compile_universe(instruments_path, pairs_path):
+    instruments = pd.read_csv(instruments_path, dtype={"instrument_token": "Int64", "name": str, "sector": str})
+    pairs = pd.read_csv(pairs_path, dtype=str)
+    for frame, path, required in (
+        (instruments, instruments_path, ["instrument_token", "name", "sector"]),
+        (pairs, pairs_path, ["stock1", "stock2"]),
+    ):
+        missing = [column for column in required if column not in frame.columns]
+        if missing:
+            raise ValueError(f"{path}: missing columns {missing}")
+        blank = frame[required].isna().any(axis=1)
+        if blank.any():
+            raise ValueError(f"{path}: empty values on rows {list(frame.index[blank] + 2)}")
+    for column in ("instrument_token", "name"):
+        duplicated = instruments[column][instruments[column].duplicated()]
+        if len(duplicated):
+            raise ValueError(f"{instruments_path}: duplicate {column} values {list(duplicated)}")
+    positions = pd.Series(np.arange(len(instruments)), index=instruments["name"])
+    unknown = sorted(set(pairs["stock1"]).union(pairs["stock2"]).difference(positions.index))
+    if unknown:
+        raise ValueError(f"{pairs_path}: names not listed in {instruments_path}: {unknown}")
+    left = positions[pairs["stock1"]].to_numpy()
+    right = positions[pairs["stock2"]].to_numpy()
+    if (left == right).any():
+        raise ValueError(f"{pairs_path}: pairs of an instrument with itself on rows {list(np.flatnonzero(left == right) + 2)}")
+    duplicated = pd.Series(list(zip(np.minimum(left, right), np.maximum(left, right)))).duplicated().to_numpy()
+    if duplicated.any():
+        raise ValueError(f"{pairs_path}: duplicate pairs on rows {list(np.flatnonzero(duplicated) + 2)}")
+    sectors = instruments["sector"].to_numpy()
+    for k in np.flatnonzero(sectors[left] != sectors[right]):
+        logger.warning(f"{pairs_path}: pair {pairs['stock1'][k]} - {pairs['stock2'][k]} spans two sectors, using {sectors[left[k]]}")
+    return {
+        "tokens": instruments["instrument_token"].to_numpy(dtype=np.int64),
+        "names": instruments["name"].to_numpy(dtype=str),
+        "sectors": sectors.astype(str),
+        "left": left.astype(np.int32),
+        "right": right.astype(np.int32),
+    }
+
+# Function to load the universe, reusing the compiled arrays when the source files have not changed
+def load_universe(directory=UNIVERSE_DIR):
+    instruments_path = os.path.join(directory, "instruments.csv")
+    pairs_path = os.path.join(directory, "pairs.csv")
+    compiled_path = os.path.join(directory, "universe.npz")
+    digest = hashlib.sha1()
+    for path in (instruments_path, pairs_path):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    source_hash = digest.hexdigest()
+    arrays = None
+    if os.path.exists(compiled_path):
+        with np.load(compiled_path) as data:
+            if str(data["source_hash"]) == source_hash:
+                arrays = {key: data[key] for key in data.files if key != "source_hash"}
+    if arrays is None:
+        arrays = compile_universe(instruments_path, pairs_path)
+        try:
+            np.savez(compiled_path, source_hash=source_hash, **arrays)
+        except OSError as e:
+            logger.warning(f"Could not write compiled universe to {compiled_path}: {e}")
+    registry = InstrumentRegistry(arrays["tokens"], arrays["names"], arrays["sectors"])
+    logger.info(f"Loaded universe of {len(registry)} instruments and {len(arrays['left'])} pairs from {directory}")
+    return registry, PairTable(arrays["left"], arrays["right"])
+
+# Price matrix (dates x instruments, columns in registry order) with an int64 nanosecond date index. Saved as
+# price_panel.npy and price_dates.npy so that later commands and worker processes memory-map it and read pairs
+# as zero-copy column views.
+class PricePanel:
+    def __init__(self, stamps, prices, directory=None):
+        self.stamps = np.asarray(stamps, dtype=np.int64)
+        self.prices = prices
+        self.directory = directory
+
+    @property
+    def dates(self):
+        return self.stamps.view("datetime64[ns]")
+
+    def save(self, directory):
+        np.save(os.path.join(directory, "price_dates.npy"), self.stamps)
+        np.save(os.path.join(directory, "price_panel.npy"), np.asarray(self.prices, dtype=np.float64))
+
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        return cls(
+            np.load(os.path.join(directory, "price_dates.npy")),
+            np.load(os.path.join(directory, "price_panel.npy"), mmap_mode=mmap_mode),
+            directory
+        )
+
+# Function to fetch every instrument of the registry once and align them into a shared price panel
+# whose columns follow the registry order
+def fetch_price_panel(registry, interval="day", days=367, refresh=OHLC_CACHE_REFRESH, cache_dir=OHLC_CACHE_DIR, as_of=None):
+    logger.info(f"Fetching {len(registry)} unique instruments")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        results = list(executor.map(
+            lambda i: fetch_ohlc(int(registry.tokens[i]), registry.names[i], registry.columns[i],
+                                 interval=interval, days=days, refresh=refresh, cache_dir=cache_dir, as_of=as_of),
+            range(len(registry))
+        ))
+    log_fetch_metrics(time.perf_counter() - started)
+    stamps = [
+        None if data is None else data["Date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        for data in results
+    ]
+    fetched = [i for i, data in enumerate(results) if data is not None]
+    run_metrics.count("instruments_fetched", len(fetched))
+    run_metrics.count("instruments_missing", len(registry) - len(fetched))
+    stale = sum(bool(results[i].attrs.get("stale")) for i in fetched)
+    run_metrics.count("instruments_stale", stale)
+    if stale:
+        logger.warning(f"{stale} of {len(fetched)} instruments are served from cache after failed fetches")
+    dates = np.unique(np.concatenate([stamps[i] for i in fetched])) if fetched else np.empty(0, dtype=np.int64)
+    prices = np.full((len(dates), len(registry)), np.nan)
+    for i in fetched:
+        prices[np.searchsorted(dates, stamps[i]), i] = results[i][registry.columns[i]].to_numpy(dtype=float)
+    logger.info(f"Built price panel with {len(dates)} dates and {len(fetched)} of {len(registry)} instruments")
+    return PricePanel(dates, prices)
+
+# Function to read the corporate-actions file (name, ex_date, factor) into instrument index, ex-date and factor
+# arrays. The factor multiplies every close before the ex-date, e.g. 0.5 for a 1:1 bonus or a 2-for-1 split.
+# A missing file means no actions, unless `required` is set.
+def load_corporate_actions(path, registry, required=False):
+    actions = {"index": np.empty(0, dtype=np.int32), "ex_date": np.empty(0, dtype=np.int64), "factor": np.empty(0)}
+    if not path or not os.path.exists(path):
+        if required:
+            raise FileNotFoundError(f"Corporate actions file {path} does not exist")
+        return actions
+    frame = pd.read_csv(path, dtype=str)
+    missing = [column for column in ("name", "ex_date", "factor") if column not in frame.columns]
+    if missing:
+        raise ValueError(f"{path}: missing columns {missing}")
+    blank = frame[["name", "ex_date", "factor"]].isna().any(axis=1)
+    if blank.any():
+        raise ValueError(f"{path}: empty values on rows {list(frame.index[blank] + 2)}")
+    positions = pd.Series(np.arange(len(registry)), index=registry.names)
+    unknown = sorted(set(frame["name"]).difference(positions.index))
+    if unknown:
+        raise ValueError(f"{path}: names not in the instrument universe: {unknown}")
+    factor = pd.to_numeric(frame["factor"], errors="coerce").to_numpy()
+    invalid = ~(factor > 0)
+    if invalid.any():
+        raise ValueError(f"{path}: factors must be positive numbers, rows {(np.flatnonzero(invalid) + 2).tolist()}")
+    ex_date = pd.to_datetime(frame["ex_date"], format="%Y-%m-%d")
+    duplicated = frame.assign(ex_date=ex_date).duplicated(["name", "ex_date"]).to_numpy()
+    if duplicated.any():
+        raise ValueError(f"{path}: duplicate actions on rows {(np.flatnonzero(duplicated) + 2).tolist()}")
+    actions["index"] = positions[frame["name"]].to_numpy(dtype=np.int32)
+    actions["ex_date"] = ex_date.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    actions["factor"] = factor
+    logger.info(f"Loaded {len(frame)} corporate actions from {path}")
+    return actions
+
+# Function to align the whole panel in one pass: back-adjust closes for the corporate actions, flag the
+# close-to-close moves still beyond jump_threshold, and measure each instrument's coverage of the panel dates.
+# With truncate_jumps the history before an instrument's last unexplained jump is dropped, so a split missing
+# from the actions file costs sample length instead of producing false residuals. Returns the aligned panel and
+# a per-instrument coverage report.
+def align_price_panel(panel, registry, actions, jump_threshold=PRICE_JUMP_THRESHOLD, truncate_jumps=True):
+    n_dates, n_instruments = panel.prices.shape
+    if not n_dates:
+        return panel, pd.DataFrame()
+    rows = np.arange(n_dates, dtype=np.int32)[:, None]
+    columns = np.arange(n_instruments)
+    # An action scales the closes strictly before its ex-date: place its factor on the last bar before the
+    # ex-date and accumulate the factors from the latest bar backwards
+    ex_rows = np.searchsorted(panel.stamps, actions["ex_date"])
+    applied = (ex_rows > 0) & (ex_rows < n_dates)
+    factors = np.ones((n_dates, n_instruments))
+    np.multiply.at(factors, (ex_rows[applied] - 1, actions["index"][applied]), actions["factor"][applied])
+    prices = panel.prices * np.cumprod(factors[::-1], axis=0)[::-1]
+    del factors
+    # Returns and gaps are measured against each instrument's previous valid bar, so missing bars neither hide a
+    # jump nor count as one
+    valid = ~np.isnan(prices)
+    last_seen = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    previous = np.vstack([np.full((1, n_instruments), -1, dtype=last_seen.dtype), last_seen[:-1]])
+    has_previous = valid & (previous >= 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = prices / prices[np.maximum(previous, 0), columns]
+    jumps = has_previous & ((ratio > 1 + jump_threshold) | (ratio < 1 / (1 + jump_threshold)))
+    longest_gap = np.where(has_previous, rows - previous - 1, 0).max(axis=0)
+    bars = valid.sum(axis=0)
+    has_data = bars > 0
+    first = valid.argmax(axis=0)
+    last = n_dates - 1 - valid[::-1].argmax(axis=0)
+    jump_count = jumps.sum(axis=0)
+    last_jump = np.where(jump_count > 0, n_dates - 1 - jumps[::-1].argmax(axis=0), 0)
+    truncated = np.zeros(n_instruments, dtype=np.int64)
+    if truncate_jumps:
+        dropped = valid & (rows < last_jump)
+        truncated = dropped.sum(axis=0)
+        prices[dropped] = np.nan
+    dates = panel.dates
+    report = pd.DataFrame({
+        "stock_name": registry.names,
+        "instrument_token": registry.tokens,
+        "sector": registry.sectors(columns),
+        "first_date": np.where(has_data, dates[first], np.datetime64("NaT")),
+        "last_date": np.where(has_data, dates[last], np.datetime64("NaT")),
+        "bars": bars,
+        "coverage": np.round(bars / n_dates, 4),
+        "leading_missing": np.where(has_data, first, n_dates),
+        "trailing_missing": np.where(has_data, n_dates - 1 - last, n_dates),
+        "interior_missing": np.where(has_data, last - first + 1 - bars, 0),
+        "longest_gap": longest_gap,
+        "adjustments": np.bincount(actions["index"][applied], minlength=n_instruments),
+        "jumps": jump_count,
+        "last_jump_date": np.where(jump_count > 0, dates[last_jump], np.datetime64("NaT")),
+        "last_jump_ratio": np.where(jump_count > 0, np.round(ratio[last_jump, columns], 4), np.nan),
+        "truncated_bars": truncated,
+    })
+    for i in np.flatnonzero(jump_count):
+        logger.warning(
+            f"{registry.names[i]}: {ratio[last_jump[i], i]:.3f}x close-to-close move on "
+            f"{pd.Timestamp(dates[last_jump[i]])} not covered by a corporate action"
+            + (f", dropping {truncated[i]} earlier bars" if truncate_jumps else "")
+        )
+    gapped = np.flatnonzero(report["interior_missing"].to_numpy() > 0)
+    if len(gapped):
+        worst = gapped[longest_gap[gapped].argmax()]
+        logger.warning(
+            f"{len(gapped)} instruments miss bars inside their history, longest gap {longest_gap[worst]} bars "
+            f"({registry.names[worst]})"
+        )
+    run_metrics.count("corporate_actions_applied", int(applied.sum()))
+    run_metrics.count("price_jumps", int(jump_count.sum()))
+    run_metrics.count("instruments_with_gaps", len(gapped))
+    logger.info(
+        f"Aligned price panel: {int(applied.sum())} corporate actions applied, "
+        f"{int((jump_count > 0).sum())} instruments with unexplained jumps"
+    )
+    return PricePanel(panel.stamps, prices), report
+
+# Function to split n_pairs into consecutive batches whose `arrays_per_pair` float64 columns of n_bars stay
+# within PAIR_BATCH_BYTES
+def pair_batches(n_bars, n_pairs, arrays_per_pair, batch_bytes=None):
+    size = max(1, (batch_bytes or PAIR_BATCH_BYTES) // max(1, n_bars * 8 * arrays_per_pair))
+    return [slice(start, min(start + size, n_pairs)) for start in range(0, n_pairs, size)]
+
+# Function to allocate (bars x pairs) result arrays named <prefix>_<key>.npy in `directory`, memory-mapped so
+# intraday results live on disk rather than in memory; in memory when directory is None
+def result_arrays(directory, prefix, keys, shape):
+    if directory is None:
+        return {key: np.empty(shape) for key in keys}
+    return {
+        key: np.lib.format.open_memmap(os.path.join(directory, f"{prefix}_{key}.npy"), mode="w+", shape=shape)
+        for key in keys
+    }
+
+# Function to fit y = intercept + beta * x in closed form for every column of the (time x pairs) matrices at once
+def batch_ols(x, y):
+    valid = ~(np.isnan(x) | np.isnan(y))
+    nobs = valid.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = np.where(valid, x, 0.0).sum(axis=0) / nobs
+        y_mean = np.where(valid, y, 0.0).sum(axis=0) / nobs
+        x_dev = np.where(valid, x - x_mean, 0.0)
+        y_dev = np.where(valid, y - y_mean, 0.0)
+        beta = (x_dev * y_dev).sum(axis=0) / (x_dev * x_dev).sum(axis=0)
+        intercept = y_mean - beta * x_mean
+        residuals = np.where(valid, y - intercept - beta * x, np.nan)
+        sse = np.where(valid, residuals, 0.0)
+        sse = (sse * sse).sum(axis=0)
+        # Two estimated parameters (intercept and slope)
+        std_error = np.where(nobs > 2, np.sqrt(sse / (nobs - 2)), np.nan)
+    return {
+        "intercept": intercept,
+        "beta": beta,
+        "residuals": residuals,
+        "std_error": std_error,
+        "nobs": nobs,
+    }
+
+# Function to compute look-ahead-free rolling regressions for every pair: each bar is fitted only on the
+# `window` bars ending at it, using cumulative sums of x, y, xy, x^2 and y^2 across the whole panel at once
+def rolling_ols(x, y, window, min_periods=None):
+    min_periods = max(3, min_periods or window)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x0 = np.where(valid, x, 0.0)
+    y0 = np.where(valid, y, 0.0)
+
+    def window_sum(values):
+        total = np.cumsum(values, axis=0)
+        total[window:] = total[window:] - total[:-window].copy()
+        return total
+
+    n = window_sum(valid.astype(float))
+    sx, sy = window_sum(x0), window_sum(y0)
+    sxy, sxx, syy = window_sum(x0 * y0), window_sum(x0 * x0), window_sum(y0 * y0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov_xy = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        beta = cov_xy / var_x
+        intercept = (sy - beta * sx) / n
+        sse = np.maximum(var_y - beta * cov_xy, 0.0)
+        std_error = np.sqrt(sse / (n - 2))
+        usable = valid & (n >= min_periods)
+        residuals = np.where(usable, y - intercept - beta * x, np.nan)
+        deviation = residuals / std_error
+    for values in (beta, intercept, std_error):
+        values[~usable] = np.nan
+    return {
+        "intercept": intercept,
+        "beta": beta,
+        "residuals": residuals,
+        "std_error": std_error,
+        "deviation": deviation,
+        "nobs": n,
+    }
+
+# Function to run rolling_ols over the panel in blocks of `chunk_rows` bars, yielding (first row, result) per block.
+# Each block is prefixed with the last window - 1 bars of the previous one so every bar still sees its full
+# window, and only the (block + window) x pairs slice of the price legs is materialised at a time.
+def stream_rolling_ols(prices, left, right, window, min_periods=None, chunk_rows=ROLLING_CHUNK_ROWS):
+    chunk_rows = max(chunk_rows, 1)
+    for start in range(0, prices.shape[0], chunk_rows):
+        stop = min(start + chunk_rows, prices.shape[0])
+        tail = max(0, start - window + 1)
+        block = rolling_ols(prices[tail:stop, left], prices[tail:stop, right], window, min_periods)
+        yield start, {key: block[key][start - tail:] for key in ("intercept", "beta", "std_error", "deviation")}
+
+# Function to collect the streamed rolling regression of every pair into (bars x pairs) result arrays, or into
+# the arrays of `out` (e.g. from result_arrays) so the results never have to fit in memory
+def chunked_rolling_ols(prices, left, right, window, min_periods=None, chunk_rows=ROLLING_CHUNK_ROWS, out=None):
+    shape = (prices.shape[0], len(left))
+    result = out or {key: np.empty(shape) for key in ("intercept", "beta", "std_error", "deviation")}
+    for start, block in stream_rolling_ols(prices, left, right, window, min_periods, chunk_rows):
+        for key, values in block.items():
+            result[key][start:start + len(values)] = values
+    return result
+
+# Running window sums for every pair, updated in O(1) per new bar. Keeps the last `window` bars in a ring buffer
+# so the outgoing bar can be subtracted, and can be saved so a daily run only feeds the bars added since.
+class RollingPairStats:
+    # Rebuild the sums from the ring buffer every this many updates to stop rounding error accumulating
+    RESYNC_EVERY = 10000
+
+    def __init__(self, n_pairs, window, min_periods=None):
+        self.window = window
+        self.min_periods = max(3, min_periods or window)
+        self.x = np.zeros((window, n_pairs))
+        self.y = np.zeros((window, n_pairs))
+        self.valid = np.zeros((window, n_pairs), dtype=bool)
+        self.sums = np.zeros((6, n_pairs))  # n, x, y, xy, x^2, y^2
+        self.position = 0
+        self.updates = 0
+        self.last_timestamp = None
+
+    def bar_sums(self, x, y, valid):
+        x = np.where(valid, x, 0.0)
+        y = np.where(valid, y, 0.0)
+        return np.stack([valid.astype(float), x, y, x * y, x * x, y * y])
+
+    # Adds the bar and drops the oldest one; returns the bar's fit like one row of rolling_ols
+    def update(self, x, y, timestamp=None):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        slot = self.position
+        self.sums -= self.bar_sums(self.x[slot], self.y[slot], self.valid[slot])
+        self.x[slot] = np.where(valid, x, 0.0)
+        self.y[slot] = np.where(valid, y, 0.0)
+        self.valid[slot] = valid
+        self.sums += self.bar_sums(x, y, valid)
+        self.position = (slot + 1) % self.window
+        self.updates += 1
+        self.last_timestamp = timestamp
+        if self.updates % self.RESYNC_EVERY == 0:
+            self.sums = self.bar_sums(self.x, self.y, self.valid).sum(axis=1)
+        intercept, beta, std_error = (np.where(valid, values, np.nan) for values in self.coefficients())
+        with np.errstate(invalid='ignore', divide='ignore'):
+            deviation = (y - intercept - beta * x) / std_error
+        return {"intercept": intercept, "beta": beta, "std_error": std_error, "deviation": deviation}
+
+    def coefficients(self):
+        n, sx, sy, sxy, sxx, syy = self.sums
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov_xy = sxy - sx * sy / n
+            var_x = sxx - sx * sx / n
+            beta = cov_xy / var_x
+            intercept = (sy - beta * sx) / n
+            sse = np.maximum(syy - sy * sy / n - beta * cov_xy, 0.0)
+            std_error = np.sqrt(sse / (n - 2))
+        ready = n >= self.min_periods
+        return np.where(ready, intercept, np.nan), np.where(ready, beta, np.nan), np.where(ready, std_error, np.nan)
+
+    def deviation(self, x, y):
+        intercept, beta, std_error = self.coefficients()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (np.asarray(y, dtype=float) - intercept - beta * np.asarray(x, dtype=float)) / std_error
+
+    # Extra arrays passed as keywords are saved alongside the state and returned by load()
+    def save(self, path, **arrays):
+        np.savez(path, x=self.x, y=self.y, valid=self.valid, sums=self.sums,
+                 position=self.position, updates=self.updates, min_periods=self.min_periods,
+                 last_timestamp=np.datetime64(self.last_timestamp or 'NaT', 'ns'), **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            stats = cls(data["x"].shape[1], data["x"].shape[0], int(data["min_periods"]))
+            stats.x, stats.y, stats.valid, stats.sums = data["x"], data["y"], data["valid"], data["sums"]
+            stats.position, stats.updates = int(data["position"]), int(data["updates"])
+            last_timestamp = data["last_timestamp"][()]
+            stats.last_timestamp = None if np.isnat(last_timestamp) else pd.Timestamp(last_timestamp)
+            arrays = {key: data[key] for key in data.files if key not in (
+                "x", "y", "valid", "sums", "position", "updates", "min_periods", "last_timestamp")}
+        return stats, arrays
+
+# Function to fingerprint every row of the given panel columns, so a saved rolling state can tell whether the
+# bars it was built on were revised, back-adjusted or truncated since
+def row_fingerprints(prices, columns, chunk_rows=ROLLING_CHUNK_ROWS):
+    weights = (np.arange(len(columns), dtype=np.uint64) * np.uint64(2) + np.uint64(1)) * np.uint64(0x9E3779B97F4A7C15)
+    fingerprints = np.empty(prices.shape[0], dtype=np.uint64)
+    for start in range(0, prices.shape[0], chunk_rows):
+        bits = np.ascontiguousarray(prices[start:start + chunk_rows, columns], dtype=np.float64).view(np.uint64)
+        fingerprints[start:start + chunk_rows] = (bits * weights).sum(axis=1, dtype=np.uint64)
+    return fingerprints
+
+# Function to compute the rolling regression of every pair, reusing the RollingPairStats state saved at
+# state_path by the previous run: its fitted rows are kept and only the bars after its last timestamp go through
+# O(1) updates. Without a saved state, or when the pairs, window or the prices of the saved rows changed, the whole
+# panel is fitted with chunked_rolling_ols. The state is saved back for the next run, with the fitted rows as
+# rolling_<key>.npy files next to it that are returned memory-mapped.
+def incremental_rolling_ols(panel, left, right, window, min_periods=None, state_path=None):
+    keys = ("intercept", "beta", "std_error", "deviation")
+    prices, stamps = panel.prices, panel.stamps
+    if not state_path:
+        return chunked_rolling_ols(prices, left, right, window, min_periods)
+    directory = os.path.dirname(state_path)
+    history_paths = {key: os.path.join(directory, f"rolling_{key}.npy") for key in keys}
+    fingerprints = row_fingerprints(prices, np.union1d(left, right))
+    stats = None
+    if os.path.exists(state_path) and all(os.path.exists(path) for path in history_paths.values()):
+        try:
+            stats, saved = RollingPairStats.load(state_path)
+            saved.update({key: np.load(path, mmap_mode="r") for key, path in history_paths.items()})
+        except Exception as e:
+            logger.warning(f"Discarding unreadable rolling state {state_path}: {e}")
+            stats = None
+    if stats is not None:
+        start = int(np.searchsorted(stamps, stats.last_timestamp.value, side="right")) if stats.last_timestamp else 0
+        if not (stats.window == window and stats.min_periods == max(3, min_periods or window)
+                and np.array_equal(saved["left"], left) and np.array_equal(saved["right"], right)
+                and 0 < start <= len(saved["stamps"])
+                and all(saved[key].shape == (len(saved["stamps"]), len(left)) for key in keys)
+                and np.array_equal(saved["stamps"][-start:], stamps[:start])
+                and np.array_equal(saved["fingerprints"][-start:], fingerprints[:start])):
+            logger.info(f"Rolling state {state_path} does not match this run's pairs or prices, refitting the whole panel")
+            stats = None
+    # New rows are written next to the saved ones, which are still read while the result is assembled
+    result = result_arrays(directory, "rolling_next", keys, (len(stamps), len(left)))
+    if stats is None:
+        chunked_rolling_ols(prices, left, right, window, min_periods, out=result)
+        stats = RollingPairStats(len(left), window, min_periods)
+        for t in range(max(0, len(stamps) - window), len(stamps)):
+            stats.update(prices[t, left], prices[t, right], panel.dates[t])
+    else:
+        for key in keys:
+            for row in range(0, start, ROLLING_CHUNK_ROWS):
+                stop = min(row + ROLLING_CHUNK_ROWS, start)
+                result[key][row:stop] = saved[key][len(saved["stamps"]) - start + row:len(saved["stamps"]) - start + stop]
+        for t in range(start, len(stamps)):
+            fit = stats.update(prices[t, left], prices[t, right], panel.dates[t])
+            for key in keys:
+                result[key][t] = fit[key]
+        logger.info(f"Rolling hedge: reused {start} fitted bars from {state_path}, updated {len(stamps) - start} new bars")
+        saved = None
+    for key in keys:
+        result[key].flush()
+        os.replace(os.path.join(directory, f"rolling_next_{key}.npy"), history_paths[key])
+    stats.save(state_path, stamps=stamps, fingerprints=fingerprints, left=left, right=right)
+    return {key: np.load(path, mmap_mode="r") for key, path in history_paths.items()}
+
+# Function to track a time-varying intercept and hedge ratio for every pair with a Kalman filter, vectorized across
+# pairs. The state (intercept, beta) follows a random walk with covariance delta / (1 - delta) * I; it starts from an
+# OLS fit on each pair's first `warmup` bars, whose residual variance is used as the observation noise. The spread
+# is the one-step forecast error and its forecast variance takes the place of the regression standard error.
+def kalman_hedge(x, y, delta=1e-4, warmup=20):
+    n_dates, n_pairs = x.shape
+    valid = ~(np.isnan(x) | np.isnan(y))
+    outputs = {key: np.full((n_dates, n_pairs), np.nan) for key in ("intercept", "beta", "residuals", "std_error")}
+    # Rows where each pair has accumulated `warmup` valid bars; the filter starts after them
+    seen = np.cumsum(valid, axis=0)
+    in_warmup = seen <= warmup
+    start = valid & in_warmup
+    with np.errstate(invalid='ignore', divide='ignore'):
+        n = start.sum(axis=0)
+        x_mean = np.where(start, x, 0.0).sum(axis=0) / n
+        y_mean = np.where(start, y, 0.0).sum(axis=0) / n
+        sxx = np.where(start, (x - x_mean) ** 2, 0.0).sum(axis=0)
+        beta = np.where(start, (x - x_mean) * (y - y_mean), 0.0).sum(axis=0) / sxx
+        intercept = y_mean - beta * x_mean
+        obs_var = np.where(start, (y - intercept - beta * x) ** 2, 0.0).sum(axis=0) / (n - 2)
+        # Initial state covariance is the OLS parameter covariance
+        p00 = obs_var * (1 / n + x_mean ** 2 / sxx)
+        p01 = -obs_var * x_mean / sxx
+        p11 = obs_var / sxx
+        state_var = delta / (1 - delta)
+        for t in range(n_dates):
+            update = valid[t] & ~in_warmup[t] & (n >= 3)
+            if not update.any():
+                continue
+            xt, yt = x[t], y[t]
+            r00, r01, r11 = p00 + state_var, p01, p11 + state_var
+            error = yt - intercept - beta * xt
+            forecast_var = r00 + 2 * xt * r01 + xt * xt * r11 + obs_var
+            k0 = (r00 + xt * r01) / forecast_var
+            k1 = (r01 + xt * r11) / forecast_var
+            outputs["residuals"][t] = np.where(update, error, np.nan)
+            outputs["std_error"][t] = np.where(update, np.sqrt(forecast_var), np.nan)
+            intercept = np.where(update, intercept + k0 * error, intercept)
+            beta = np.where(update, beta + k1 * error, beta)
+            p00 = np.where(update, r00 - k0 * k0 * forecast_var, p00)
+            p01 = np.where(update, r01 - k0 * k1 * forecast_var, p01)
+            p11 = np.where(update, r11 - k1 * k1 * forecast_var, p11)
+            outputs["intercept"][t] = np.where(update, intercept, np.nan)
+            outputs["beta"][t] = np.where(update, beta, np.nan)
+        outputs["deviation"] = outputs["residuals"] / outputs["std_error"]
+    return outputs
+
+# Function to run kalman_hedge on batches of pairs sized to PAIR_BATCH_BYTES, writing into the arrays of `out`
+# (e.g. from result_arrays) or into new in-memory arrays; pairs are independent so the results are the same
+def chunked_kalman_hedge(prices, left, right, delta=1e-4, warmup=20, out=None):
+    shape = (prices.shape[0], len(left))
+    result = out or {key: np.empty(shape) for key in ("intercept", "beta", "std_error", "deviation")}
+    for batch in pair_batches(shape[0], shape[1], 12):
+        block = kalman_hedge(prices[:, left[batch]], prices[:, right[batch]], delta=delta, warmup=warmup)
+        for key, values in result.items():
+            values[:, batch] = block[key]
+    return result
+
+# Function to turn deviation z-scores into spread positions for every pair without looping over bars.
+# Enter long the spread (BUY stock2, SELL stock1) at z <= -entry and short at z >= entry, exit once z has
+# reverted to within `exit_z` of the mean on the entry side, and stop out at |z| >= stop. Positions are
+# built from entry/exit events that are forward filled, so the state machine is a handful of array passes.
+def backtest_positions(deviation, entry_z, exit_z, stop_z):
+    z = deviation
+    with np.errstate(invalid='ignore'):
+        in_band = (np.abs(z) >= entry_z) & (np.abs(z) < stop_z)
+        entries = np.where(in_band, -np.sign(z), np.nan)
+        direction = pd.DataFrame(entries).ffill().fillna(0.0).to_numpy()
+        exits = (-direction * z <= exit_z) | (np.abs(z) >= stop_z) | np.isnan(z)
+    events = np.where(in_band, entries, np.where(exits, 0.0, np.nan))
+    return pd.DataFrame(events).ffill().fillna(0.0).to_numpy()
+
+# Function to summarize (time x series) return streams: total return, annualized Sharpe, max drawdown and trades
+def performance_summary(returns, positions, periods_per_year=252):
+    equity = np.cumsum(returns, axis=0)
+    drawdown = np.maximum.accumulate(np.vstack([np.zeros((1, returns.shape[1])), equity]), axis=0)[1:] - equity
+    previous = np.vstack([np.zeros((1, positions.shape[1])), positions[:-1]])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = returns.std(axis=0, ddof=1)
+        sharpe = np.where(std > 0, returns.mean(axis=0) / std * np.sqrt(periods_per_year), np.nan)
+    return {
+        "total_return": equity[-1] if len(equity) else np.zeros(returns.shape[1]),
+        "sharpe": sharpe,
+        "max_drawdown": drawdown.max(axis=0) if len(drawdown) else np.zeros(returns.shape[1]),
+        "trades": ((positions != 0) & (positions != previous)).sum(axis=0),
+        "exposure": (positions != 0).mean(axis=0),
+    }
+
+# Function to backtest the deviation signals of every pair at once. Returns are per unit of gross notional
+# (|stock2| + |beta * stock1|) of the previous bar, positions trade at the close of the signal bar and
+# `cost_bps` is charged on every change in position. Sector results use the equal-weighted mean of their pairs.
+def backtest_pairs(deviation, x, y, beta, sectors, entry_z=SIGNAL_THRESHOLD, exit_z=0.0, stop_z=4.0, cost_bps=5.0,
+                   periods_per_year=252):
+    if len(sectors) == 0:
+        metrics = ["total_return", "sharpe", "max_drawdown", "trades", "exposure"]
+        return pd.DataFrame(columns=["sector"] + metrics), pd.DataFrame(columns=["sector", "pairs"] + metrics)
+    positions = backtest_positions(deviation, entry_z, exit_z, stop_z)
+    beta = np.broadcast_to(beta, x.shape)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spread_change = np.diff(y, axis=0) - beta[:-1] * np.diff(x, axis=0)
+        notional = np.abs(y[:-1]) + np.abs(beta[:-1] * x[:-1])
+        gross = positions[:-1] * spread_change / notional
+    turnover = np.abs(np.diff(positions, axis=0))
+    returns = np.nan_to_num(gross) - turnover * cost_bps / 1e4
+    returns = np.vstack([np.zeros((1, returns.shape[1])), returns])
+    pair_results = pd.DataFrame(performance_summary(returns, positions, periods_per_year))
+    pair_results.insert(0, "sector", sectors)
+    sector_names = sorted(set(sectors))
+    sectors = np.asarray(sectors)
+    sector_returns = np.column_stack([returns[:, sectors == name].mean(axis=1) for name in sector_names])
+    sector_positions = np.column_stack([np.abs(positions[:, sectors == name]).max(axis=1) for name in sector_names])
+    sector_results = pd.DataFrame(performance_summary(sector_returns, sector_positions, periods_per_year))
+    sector_results["trades"] = [pair_results["trades"][sectors == name].sum() for name in sector_names]
+    sector_results.insert(0, "pairs", [int((sectors == name).sum()) for name in sector_names])
+    sector_results.insert(0, "sector", sector_names)
+    return pair_results, sector_results
+
+# Price panel of a sweep worker process: memory-mapped by init_sweep_worker, or the caller's panel when the sweep
+# runs in-process
+sweep_worker_state = {}
+
+# Function to memory-map the price panel saved in panel_dir in a sweep worker process
+def init_sweep_worker(panel_dir, log_level=logging.INFO):
+    logging.getLogger().setLevel(log_level)
+    panel = PricePanel.load(panel_dir)
+    sweep_worker_state.update(dates=panel.dates, prices=panel.prices)
+
+# Function to evaluate a chunk of the threshold combinations for one lookback; runs in a sweep worker process.
+# The regression is fitted once per task and each grid point only re-runs the array backtest.
+def sweep_lookback(task):
+    dates = sweep_worker_state["dates"]
+    prices = sweep_worker_state["prices"]
+    # Dates are sorted, so the lookback is a suffix of the panel and the legs are read from it directly
+    start = int(np.searchsorted(dates, dates[-1] - np.timedelta64(task["lookback"], "D")))
+    x = np.asarray(prices[start:, task["left"]])
+    y = np.asarray(prices[start:, task["right"]])
+    regression = batch_ols(x, y)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        deviation = regression["residuals"] / regression["std_error"]
+    results = []
+    for entry_z, exit_z, stop_z in task["grid"]:
+        _, sector_results = backtest_pairs(
+            deviation, x, y, regression["beta"], task["sectors"],
+            entry_z=entry_z, exit_z=exit_z, stop_z=stop_z, cost_bps=task["cost_bps"],
+            periods_per_year=task["periods_per_year"]
+        )
+        sector_results.insert(0, "stop_z", stop_z)
+        sector_results.insert(0, "exit_z", exit_z)
+        sector_results.insert(0, "entry_z", entry_z)
+        sector_results.insert(0, "lookback_days", task["lookback"])
+        results.append(sector_results)
+    logger.info(f"Sweep lookback {task['lookback']} days: {len(task['grid'])} threshold combinations evaluated")
+    return pd.concat(results, ignore_index=True)
+
+# Function to grid-search lookback and entry/exit/stop thresholds across all pairs and rank them per sector.
+# Prices are fetched once for the longest lookback and shorter lookbacks are slices of the same panel. Tasks are
+# (lookback, chunk of the threshold grid) so a short lookback list still spreads over every worker, and workers
+# memory-map the saved panel instead of receiving copies of the legs.
+def run_sweep(panel, pairs, registry, lookbacks, entries, exits, stops, cost_bps, workers, save_dir,
+              periods_per_year=252):
+    grid = [
+        (entry_z, exit_z, stop_z)
+        for entry_z in entries for exit_z in exits for stop_z in stops
+        if exit_z < entry_z < stop_z
+    ]
+    if panel.prices.shape[0] == 0 or len(pairs) == 0:
+        logger.warning("No bars or no pairs to sweep, returning an empty sweep table")
+        return pd.DataFrame(columns=[
+            "rank", "lookback_days", "entry_z", "exit_z", "stop_z", "sector", "pairs",
+            "total_return", "sharpe", "max_drawdown", "trades", "exposure",
+        ])
+    chunk_size = max(1, -(-len(grid) // max(1, workers // len(lookbacks))))
+    sectors = registry.sectors(pairs.left)
+    tasks = [
+        {
+            "lookback": lookback, "left": pairs.left, "right": pairs.right, "grid": chunk, "sectors": sectors,
+            "cost_bps": cost_bps, "periods_per_year": periods_per_year,
+        }
+        for lookback in lookbacks
+        for chunk in (grid[i:i + chunk_size] for i in range(0, max(len(grid), 1), chunk_size))
+    ]
+    logger.info(
+        f"Sweeping {len(lookbacks)} lookbacks x {len(grid)} threshold combinations over {len(pairs)} pairs "
+        f"in {len(tasks)} tasks"
+    )
+    if workers <= 1 or len(tasks) <= 1:
+        sweep_worker_state.update(dates=panel.dates, prices=panel.prices)
+        results = [sweep_lookback(task) for task in tasks]
+    else:
+        if panel.directory is None:
+            panel.save(save_dir)
+            panel.directory = save_dir
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=init_sweep_worker,
+            initargs=(panel.directory, logging.getLogger().level)
+        ) as executor:
+            results = list(executor.map(sweep_lookback, tasks))
+    results = pd.concat(results, ignore_index=True)
+    results = results.sort_values(["sector", "sharpe"], ascending=[True, False], na_position="last")
+    results.insert(0, "rank", results.groupby("sector").cumcount() + 1)
+    return results.reset_index(drop=True)
+
+# Function to discover pairs within each sector: one correlation matrix of daily log returns over the whole
+# universe, pruning by correlation and by the mean-reversion half-life of the spread, then Engle-Granger
+# cointegration tests on the survivors only. Returns a PairTable and the statistics of each discovered pair.
+def discover_pairs(prices, registry, min_correlation=0.5, max_half_life=60.0, max_p_value=0.05):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        returns = np.diff(np.log(prices), axis=0)
+        valid = ~np.isnan(returns)
+        counts = valid.sum(axis=0)
+        mean = np.where(valid, returns, 0.0).sum(axis=0) / counts
+        std = np.sqrt(np.where(valid, (returns - mean) ** 2, 0.0).sum(axis=0) / counts)
+        standardized = np.where(valid, (returns - mean) / std, 0.0)
+        # Pairwise-complete correlation from a single matrix product
+        overlap = valid.T.astype(float) @ valid.astype(float)
+        correlation = standardized.T @ standardized / overlap
+    same_sector = np.triu(registry.sector_codes[:, None] == registry.sector_codes[None, :], k=1)
+    left, right = np.nonzero(same_sector & (correlation >= min_correlation))
+    logger.info(
+        f"Pair discovery: {len(registry)} instruments, {int(same_sector.sum())} same-sector combinations, "
+        f"{len(left)} with return correlation >= {min_correlation}"
+    )
+    empty = (PairTable([], []), {"correlation": np.array([]), "half_life": np.array([]), "coint_p_value": np.array([])})
+    if not len(left):
+        return empty
+    residuals = batch_ols(prices[:, left], prices[:, right])["residuals"]
+    # Half-life from the AR(1) regression of the spread change on the lagged spread
+    reversion = batch_ols(residuals[:-1], np.diff(residuals, axis=0))["beta"]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        half_life = np.where(reversion < 0, -np.log(2) / reversion, np.inf)
+    survivors = np.flatnonzero(half_life <= max_half_life)
+    logger.info(f"Pair discovery: {len(survivors)} candidates with spread half-life <= {max_half_life} bars")
+    if not len(survivors):
+        return empty
+    p_value = batch_adfuller(
+        [residuals[:, k][~np.isnan(residuals[:, k])] for k in survivors], n_series=2
+    )["p_value"]
+    cointegrated = p_value <= max_p_value
+    survivors, p_value = survivors[cointegrated], p_value[cointegrated]
+    order = np.lexsort((p_value, registry.sector_codes[left[survivors]]))
+    survivors, p_value = survivors[order], p_value[order]
+    logger.info(f"Pair discovery: {len(survivors)} pairs cointegrated at p <= {max_p_value}")
+    return PairTable(left[survivors], right[survivors]), {
+        "correlation": correlation[left[survivors], right[survivors]],
+        "half_life": half_life[survivors],
+        "coint_p_value": p_value,
+    }
+
+# Function to take the last non-missing value of every column of a (time x pairs) matrix
+def last_valid(values):
+    result = np.full(values.shape[1], np.nan)
+    for batch in pair_batches(values.shape[0], values.shape[1], 2):
+        block = np.asarray(values[:, batch])
+        valid = ~np.isnan(block)
+        rows = block.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+        result[batch] = np.where(valid.any(axis=0), block[rows, np.arange(block.shape[1])], np.nan)
+    return result
+
+# Function to build the ADF regression (constant, lagged level, lagged differences) for a stack of equal-length series
+def adf_design(values, lag):
+    diffs = np.diff(values, axis=1)
+    nobs = diffs.shape[1] - lag
+    columns = [np.ones((values.shape[0], nobs)), values[:, lag:lag + nobs]]
+    columns += [diffs[:, lag - i:lag - i + nobs] for i in range(1, lag + 1)]
+    return diffs[:, lag:], np.stack(columns, axis=2)
+
+# Function to run the augmented Dickey-Fuller test on many series at once with stacked least squares.
+# Matches statsmodels adfuller(regression="c"); n_series=2 gives Engle-Granger p-values for residuals.
+def batch_adfuller(series, maxlag=None, autolag="AIC", n_series=1, batch_bytes=None):
+    from statsmodels.tsa.adfvalues import mackinnonp
+    adf_stat = np.full(len(series), np.nan)
+    used_lag = np.full(len(series), -1)
+    nobs_used = np.zeros(len(series), dtype=int)
+    lengths = np.array([len(s) for s in series])
+    for length in np.unique(lengths):
+        same_length = np.flatnonzero(lengths == length)
+        group_maxlag = maxlag
+        if group_maxlag is None:
+            group_maxlag = min(length // 2 - 2, int(np.ceil(12.0 * np.power(length / 100.0, 1 / 4.0))))
+        if group_maxlag < 0 or group_maxlag > length // 2 - 2:
+            logger.warning(f"Skipping ADF for {len(same_length)} series of length {length}: too short for maxlag {group_maxlag}")
+            continue
+        # The design matrix, its Q factor and their products hold about three (length x maxlag + 2) blocks per
+        # series, so series are stacked in batches that keep those within the batch budget
+        batch_size = max(1, (batch_bytes or PAIR_BATCH_BYTES) // (length * (group_maxlag + 2) * 8 * 3))
+        for first in range(0, len(same_length), batch_size):
+            group = same_length[first:first + batch_size]
+            values = np.stack([np.asarray(series[i], dtype=float) for i in group])
+            lags = np.full(len(group), group_maxlag)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if autolag:
+                    # Same sample for every lag length so the information criteria are comparable
+                    y, X = adf_design(values, group_maxlag)
+                    Q, _ = np.linalg.qr(X)
+                    projected = np.cumsum(np.einsum('pnk,pn->pk', Q, y) ** 2, axis=1)
+                    ssr = (y * y).sum(axis=1)[:, None] - projected[:, 1:]
+                    k = np.arange(2, X.shape[2] + 1)
+                    nobs = y.shape[1]
+                    aic = nobs * (np.log(2 * np.pi) + np.log(ssr / nobs) + 1) + 2 * k
+                    lags = np.argmin(aic, axis=1)
+                    del Q, X
+                for lag in np.unique(lags):
+                    members = np.flatnonzero(lags == lag)
+                    y, X = adf_design(values[members], lag)
+                    Q, R = np.linalg.qr(X)
+                    coef = np.linalg.solve(R, np.einsum('pnk,pn->pk', Q, y)[:, :, None])[:, :, 0]
+                    residuals = y - np.einsum('pnk,pk->pn', X, coef)
+                    sigma2 = (residuals * residuals).sum(axis=1) / (y.shape[1] - X.shape[2])
+                    R_inv = np.linalg.inv(R)
+                    level_var = sigma2 * (R_inv[:, 1, :] ** 2).sum(axis=1)
+                    adf_stat[group[members]] = coef[:, 1] / np.sqrt(level_var)
+                    used_lag[group[members]] = lag
+                    nobs_used[group[members]] = y.shape[1]
+    p_value = np.array([
+        mackinnonp(stat, regression="c", N=n_series) if np.isfinite(stat) else np.nan
+        for stat in adf_stat
+    ])
+    return {
+        "adf_stat": adf_stat,
+        "p_value": p_value,
+        "used_lag": used_lag,
+        "nobs": nobs_used,
+    }
+
+# Function to fit the static regression and ADF test of every pair in batches sized to PAIR_BATCH_BYTES, so only
+# one batch of legs and residuals is in memory at a time. Each batch's deviation is written into `deviation` when
+# given. Returns the per-pair regression (without residuals) and ADF results.
+def fit_static_hedge(prices, left, right, deviation=None, maxlag=None, autolag="AIC"):
+    fits, tests = [], []
+    for batch in pair_batches(prices.shape[0], len(left), 12) or [slice(0, 0)]:
+        with run_metrics.stage("ols"):
+            fit = batch_ols(np.asarray(prices[:, left[batch]]), np.asarray(prices[:, right[batch]]))
+            residuals = fit.pop("residuals")
+            if deviation is not None:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    deviation[:, batch] = residuals / fit["std_error"]
+        with run_metrics.stage("adf"):
+            tests.append(batch_adfuller(
+                [residuals[:, j][~np.isnan(residuals[:, j])] for j in range(residuals.shape[1])],
+                maxlag=maxlag, autolag=autolag
+            ))
+        fits.append(fit)
+    return (
+        {key: np.concatenate([fit[key] for fit in fits]) for key in fits[0]},
+        {key: np.concatenate([test[key] for test in tests]) for key in tests[0]},
+    )
+
 def send_email(csv_filepath):
+    import smtplib
+    from email import encoders
+    from email.mime.base import MIMEBase
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
     sender_email = os.environ.get('SENDER_EMAIL')
     receiver_email = os.environ.get('RECEIVER_EMAIL')
     subject = "Pair Trading Signals CSV"
@@ -1126,97 +1441,788 @@ def send_email(csv_filepath):
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
 
-def main():
-    save_dir = "/tmp/test_results"
-    os.makedirs(save_dir, exist_ok=True)
-    folder_id = os.environ.get('GOOGLE_DRIVE_FOLDER_ID')
-    all_signals = []
-    for pair in stock_pairs:
-        stock1 = pair["stock1"]
-        stock2 = pair["stock2"]
-        sector = stock1["sector"]
-        logger.info(f"Processing pair: {stock1['name']} - {stock2['name']} ({sector})")
-        stock_data = {
-            stock1["name"]: fetch_ohlc(stock1["instrument_token"], stock1["name"], stock1["column"]),
-            stock2["name"]: fetch_ohlc(stock2["instrument_token"], stock2["name"], stock2["column"])
-        }
-        if any(data is None for data in stock_data.values()):
-            logger.warning(f"Skipping pair {stock1['name']} - {stock2['name']} due to missing data")
+# Per-process view of the shared price panel and deviation matrix used by analyze_pair
+pair_worker_state = {}
+
+# Function to set the read-only data that analyze_pair works on in the current process
+def set_pair_worker_state(dates, prices, deviation, save_dir):
+    pair_worker_state.update(dates=dates, prices=prices, deviation=deviation, save_dir=save_dir)
+
+# Function to memory-map the price panel and deviation matrix saved by run_pair_stage in a worker process
+def init_pair_worker(panel_dir, deviation_path, save_dir, dump_path=None, log_level=logging.INFO):
+    logging.getLogger().setLevel(log_level)
+    configure_debug_dump(dump_path)
+    panel = PricePanel.load(panel_dir)
+    set_pair_worker_state(panel.dates, panel.prices, np.load(deviation_path, mmap_mode="r"), save_dir)
+
+# Function to tag the signals of one pair; safe to run in a worker process
+def analyze_pair(task):
+    dates = pair_worker_state["dates"]
+    prices = pair_worker_state["prices"]
+    stock1_name = task["stock1_name"]
+    stock2_name = task["stock2_name"]
+    sector = task["sector"]
+    deviation = pair_worker_state["deviation"][:, task["index"]]
+    valid = ~np.isnan(deviation)
+    if not valid.any():
+        logger.warning("Empty DataFrame for %s - %s", stock1_name, stock2_name)
+        return None
+    dump_logger.debug("%s - %s (%s) latest prices:\n%s", stock1_name, stock2_name, sector, LazyText(lambda: pd.DataFrame({
+        f"{stock1_name}_Close": prices[valid, task["stock1_index"]],
+        f"{stock2_name}_Close": prices[valid, task["stock2_index"]],
+    }, index=dates[valid]).tail(20).to_string()))
+    deviation = deviation[valid]
+    buy = deviation < -SIGNAL_THRESHOLD
+    flagged = buy | (deviation > SIGNAL_THRESHOLD)
+    adf_p_value = task["adf_p_value"]
+    signal_df = pd.DataFrame({
+        "deviation_from_std_error": deviation[flagged],
+        "signal": np.where(buy[flagged], f"BUY {stock2_name}, SELL {stock1_name}", f"SELL {stock2_name}, BUY {stock1_name}"),
+        "stock1_name": stock1_name,
+        "stock2_name": stock2_name,
+        "sector": sector,
+        "date": dates[valid][flagged],
+        "adf_p_value": adf_p_value,
+    })
+    logger.info(
+        "Pair %s - %s (%s): intercept %.4f, beta %.4f, std error %.4f, ADF %.3f (p=%.4f), deviation %.2f, %d signal bars",
+        stock1_name, stock2_name, sector, task["intercept"], task["beta"], task["std_error"], task["adf_stat"],
+        adf_p_value, deviation[-1], len(signal_df)
+    )
+    dump_logger.debug("%s - %s signals:\n%s", stock1_name, stock2_name, LazyText(lambda: signal_df.tail(10).to_string()))
+    return signal_df
+
+# Function to return the last bar date stored for each pair by runs other than `run_date`, whose partition is
+# about to be replaced. Read from the small watermark file the previous run left in the store; the partitions
+# themselves are only scanned when that file is missing or belongs to a later run date.
+def signal_store_watermarks(store_dir, run_date):
+    watermark_path = os.path.join(store_dir, "_watermarks.parquet")
+    if os.path.exists(watermark_path):
+        marks = pd.read_parquet(watermark_path)
+        if not len(marks) or marks["run_date"].iloc[0] <= run_date:
+            column = "previous_date" if len(marks) and marks["run_date"].iloc[0] == run_date else "date"
+            return marks.set_index(["stock1_name", "stock2_name"])[column]
+    paths = [
+        path for path in glob.glob(os.path.join(store_dir, "run_date=*", "sector=*", "*.parquet"))
+        if not path.startswith(os.path.join(store_dir, f"run_date={run_date}") + os.sep)
+    ]
+    if not paths:
+        return pd.Series(dtype="datetime64[ns]")
+    stored = pd.concat([pd.read_parquet(path, columns=["date", "stock1_name", "stock2_name"]) for path in paths])
+    return stored.groupby(["stock1_name", "stock2_name"])["date"].max()
+
+# Function to append the bars not stored yet to the signal store dataset, partitioned as
+# signal_store/run_date=YYYY-MM-DD/sector=<name>/signals_<run_date>_<sector>.parquet, and rewrite the
+# latest_signals.parquet view next to it holding the most recent bar of every pair.
+# Rerunning on the same day replaces that day's partition. Returns the paths written.
+def write_signal_store(save_dir, run_date, dates, deviation, beta, adf_p_value, pairs, registry):
+    stock1 = registry.names[pairs.left]
+    stock2 = registry.names[pairs.right]
+    sectors = registry.sectors(pairs.left)
+    buy = np.array([f"BUY {name2}, SELL {name1}" for name1, name2 in zip(stock1, stock2)], dtype=object)
+    sell = np.array([f"SELL {name2}, BUY {name1}" for name1, name2 in zip(stock1, stock2)], dtype=object)
+    beta = np.broadcast_to(beta, deviation.shape)
+
+    def records(rows, columns):
+        values = deviation[rows, columns]
+        return pd.DataFrame({
+            "date": dates[rows],
+            "stock1_name": stock1[columns],
+            "stock2_name": stock2[columns],
+            "sector": sectors[columns],
+            "deviation_from_std_error": values,
+            "signal": np.where(values < -SIGNAL_THRESHOLD, buy[columns],
+                               np.where(values > SIGNAL_THRESHOLD, sell[columns], None)),
+            "beta": beta[rows, columns],
+            "adf_p_value": adf_p_value[columns],
+        })
+
+    if deviation.shape[0] == 0 or len(pairs) == 0:
+        logger.warning("Signal store: no bars to store, leaving the store and latest_signals.parquet unchanged")
+        return []
+    store_dir = os.path.join(save_dir, "signal_store")
+    watermarks = signal_store_watermarks(store_dir, run_date)
+    since = watermarks.reindex(pd.MultiIndex.from_arrays([stock1, stock2])).to_numpy(dtype="datetime64[ns]")
+    partition_dir = os.path.join(store_dir, f"run_date={run_date}")
+    shutil.rmtree(partition_dir, ignore_errors=True)
+    paths = []
+    stored = since.copy()
+    last_rows = np.full(len(pairs), -1)
+    appended = updated = 0
+    # One sector at a time, so only that sector's columns of the deviation matrix are read and tabulated
+    for sector in np.unique(sectors):
+        columns = np.flatnonzero(sectors == sector)
+        valid = ~np.isnan(np.asarray(deviation[:, columns]))
+        fresh = valid & ((dates[:, None] > since[columns]) | np.isnat(since[columns]))
+        has_fresh = fresh.any(axis=0)
+        stored[columns] = np.where(has_fresh, dates[len(dates) - 1 - np.argmax(fresh[::-1], axis=0)], since[columns])
+        last_rows[columns] = np.where(valid.any(axis=0), len(dates) - 1 - np.argmax(valid[::-1], axis=0), -1)
+        rows, offsets = np.nonzero(fresh)
+        if not len(rows):
             continue
-        df = stock_data[stock1["name"]].set_index("Date")[[stock1["column"]]].join(
-            stock_data[stock2["name"]].set_index("Date")[[stock2["column"]]], how="inner"
+        directory = os.path.join(partition_dir, f"sector={quote(sector, safe='')}")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"signals_{run_date}_{re.sub(r'[^A-Za-z0-9]+', '_', sector)}.parquet")
+        records(rows, columns[offsets]).drop(columns="sector").to_parquet(path, index=False)
+        paths.append(path)
+        appended += len(rows)
+        updated += int(has_fresh.sum())
+    # Carry the watermarks of pairs not in this run forward, so they survive a run on a subset of the pairs
+    marks = pd.DataFrame({"stock1_name": stock1, "stock2_name": stock2, "previous_date": since, "date": stored})
+    others = watermarks[~watermarks.index.isin(marks.set_index(["stock1_name", "stock2_name"]).index)]
+    if len(others):
+        others = others.rename("previous_date").reset_index().assign(date=lambda frame: frame["previous_date"])
+        marks = pd.concat([marks, others], ignore_index=True)
+    marks.insert(0, "run_date", run_date)
+    os.makedirs(store_dir, exist_ok=True)
+    marks.to_parquet(os.path.join(store_dir, "_watermarks.parquet"), index=False)
+    has_bars = last_rows >= 0
+    latest = records(last_rows[has_bars], np.flatnonzero(has_bars))
+    latest.insert(0, "run_date", run_date)
+    latest_path = os.path.join(save_dir, "latest_signals.parquet")
+    latest.to_parquet(latest_path, index=False)
+    paths.append(latest_path)
+    run_metrics.count("signal_store_bars", appended)
+    logger.info(
+        f"Signal store: appended {appended} bars for {updated} pairs "
+        f"in {len(paths) - 1} sector partitions under {partition_dir}"
+    )
+    return paths
+
+# Function to turn a tick timestamp (datetime from KiteTicker, epoch seconds from a recording) into epoch seconds
+def tick_epoch(value):
+    if value is None:
+        return np.nan
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+# Live spread monitor: keeps the latest price of every registry instrument in a preallocated array, recomputes the
+# deviation of all pairs in one vectorized step per tick batch with the hedge fitted by the daily run, and alerts
+# when a pair moves beyond the signal threshold. Optionally records the batches it receives for replay.
+class LiveSpreadMonitor:
+    # Log throughput and latency every this many tick batches
+    REPORT_EVERY = 500
+
+    def __init__(self, registry, pairs, hedge, last_prices, threshold=SIGNAL_THRESHOLD, alert_path=None, record_path=None):
+        self.registry = registry
+        self.pairs = pairs
+        self.intercept = np.asarray(hedge["intercept"], dtype=float)
+        self.beta = np.asarray(hedge["beta"], dtype=float)
+        self.std_error = np.asarray(hedge["std_error"], dtype=float)
+        self.threshold = threshold
+        self.prices = np.array(last_prices, dtype=float)
+        self.exchange_times = np.full(len(registry), np.nan)
+        self.token_order = np.argsort(registry.tokens)
+        self.sorted_tokens = registry.tokens[self.token_order]
+        self.zone = self.zones(self.deviation())
+        self.alert_file = open(alert_path, "a") if alert_path else None
+        self.record_file = open(record_path, "a") if record_path else None
+        self.stats = {"batches": 0, "ticks": 0, "alerts": 0, "latency_ms": []}
+
+    def deviation(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (self.prices[self.pairs.right] - self.intercept
+                    - self.beta * self.prices[self.pairs.left]) / self.std_error
+
+    def zones(self, deviation):
+        return np.where(deviation > self.threshold, 1, np.where(deviation < -self.threshold, -1, 0)).astype(np.int8)
+
+    def on_ticks(self, ticks, received_at=None):
+        started = time.perf_counter()
+        received_at = time.time() if received_at is None else received_at
+        count = len(ticks)
+        tokens = np.fromiter((tick["instrument_token"] for tick in ticks), dtype=np.int64, count=count)
+        last_prices = np.fromiter((tick["last_price"] for tick in ticks), dtype=float, count=count)
+        exchange_times = np.fromiter((tick_epoch(tick.get("exchange_timestamp")) for tick in ticks), dtype=float, count=count)
+        if self.record_file:
+            self.record_file.write(json.dumps({"received_at": received_at, "ticks": [
+                {"instrument_token": int(token), "last_price": float(price),
+                 "exchange_timestamp": None if np.isnan(stamp) else float(stamp)}
+                for token, price, stamp in zip(tokens, last_prices, exchange_times)
+            ]}) + "\n")
+        slots = np.minimum(np.searchsorted(self.sorted_tokens, tokens), len(self.sorted_tokens) - 1)
+        known = self.sorted_tokens[slots] == tokens
+        instruments = self.token_order[slots[known]]
+        self.prices[instruments] = last_prices[known]
+        self.exchange_times[instruments] = exchange_times[known]
+        deviation = self.deviation()
+        zone = self.zones(deviation)
+        crossed = np.flatnonzero((zone != self.zone) & (zone != 0))
+        self.zone = zone
+        for k in crossed:
+            self.alert(k, deviation[k], received_at, started)
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.stats["batches"] += 1
+        self.stats["ticks"] += count
+        self.stats["latency_ms"].append(latency_ms)
+        if self.stats["batches"] % self.REPORT_EVERY == 0:
+            self.report()
+        return crossed
+
+    def alert(self, k, deviation, received_at, started):
+        stock1 = self.registry.names[self.pairs.left[k]]
+        stock2 = self.registry.names[self.pairs.right[k]]
+        signal = f"BUY {stock2}, SELL {stock1}" if deviation < 0 else f"SELL {stock2}, BUY {stock1}"
+        processing_ms = (time.perf_counter() - started) * 1000
+        exchange_time = np.nanmax(self.exchange_times[[self.pairs.left[k], self.pairs.right[k]]])
+        latency_ms = processing_ms + (received_at - exchange_time) * 1000 if not np.isnan(exchange_time) else np.nan
+        self.stats["alerts"] += 1
+        logger.warning(
+            f"ALERT {stock1} - {stock2} ({self.registry.sectors(self.pairs.left[k])}): deviation {deviation:.2f}, "
+            f"{signal}, latency {latency_ms:.0f}ms from exchange, {processing_ms:.2f}ms processing"
+        )
+        if self.alert_file:
+            self.alert_file.write(json.dumps({
+                "time": datetime.now().isoformat(), "stock1_name": stock1, "stock2_name": stock2,
+                "deviation_from_std_error": float(deviation), "signal": signal,
+                "latency_ms": None if np.isnan(latency_ms) else round(latency_ms, 3),
+                "processing_ms": round(processing_ms, 3),
+            }) + "\n")
+            self.alert_file.flush()
+
+    def report(self):
+        latency = np.array(self.stats["latency_ms"][-self.REPORT_EVERY:])
+        if not len(latency):
+            return
+        logger.info(
+            f"Live monitor: {self.stats['batches']} batches, {self.stats['ticks']} ticks, {self.stats['alerts']} alerts, "
+            f"batch processing p50 {np.percentile(latency, 50):.3f}ms, p99 {np.percentile(latency, 99):.3f}ms"
         )
-        df.index = pd.to_datetime(df.index)
-        df = df.dropna()
-        if df.empty:
-            logger.warning(f"Empty DataFrame for {stock1['name']} - {stock2['name']}")
+
+    def close(self):
+        self.report()
+        for f in (self.alert_file, self.record_file):
+            if f:
+                f.close()
+
+# Function to feed recorded tick batches to a monitor; speed 1 keeps the recorded pacing, 0 replays without waiting
+def replay_ticks(path, monitor, speed=0.0):
+    previous = None
+    with open(path) as f:
+        for line in f:
+            batch = json.loads(line)
+            if speed > 0 and previous is not None:
+                time.sleep(max(0.0, (batch["received_at"] - previous) / speed))
+            previous = batch["received_at"]
+            monitor.on_ticks(batch["ticks"], received_at=batch["received_at"])
+
+# Function to stream full-mode ticks for every registry instrument from the Kite websocket into a monitor;
+# blocks until the connection is closed (KiteTicker reconnects on its own after drops)
+def run_live_ticker(monitor, registry):
+    tokens = [int(token) for token in registry.tokens]
+    from kiteconnect import KiteTicker
+    ticker = KiteTicker(os.environ.get('KITE_API_KEY'), os.environ.get('KITE_ACCESS_TOKEN'))
+
+    def on_connect(ws, response):
+        ws.subscribe(tokens)
+        ws.set_mode(ws.MODE_FULL, tokens)
+        logger.info(f"Live monitor subscribed to {len(tokens)} instruments")
+
+    ticker.on_connect = on_connect
+    ticker.on_ticks = lambda ws, ticks: monitor.on_ticks(ticks)
+    ticker.on_close = lambda ws, code, reason: logger.warning(f"Ticker connection closed: {code} {reason}")
+    ticker.on_error = lambda ws, code, reason: logger.error(f"Ticker error: {code} {reason}")
+    ticker.connect(threaded=False)
+
+# Per-process chart figure, built once and reused for every pair rendered by that process
+chart_template = {}
+
+# Function to build the spread chart figure and artists that render_chart updates in place
+def get_chart_template():
+    if not chart_template:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        figure, ax = plt.subplots(figsize=(14, 6))
+        line, = ax.plot([], [], label="Deviation from Std Error", color="blue")
+        ax.axhline(SIGNAL_THRESHOLD, color="red", linestyle="--", label=f"+{SIGNAL_THRESHOLD} Std Error")
+        ax.axhline(-SIGNAL_THRESHOLD, color="green", linestyle="--", label=f"-{SIGNAL_THRESHOLD} Std Error")
+        ax.axhline(0, color="black", linestyle="-")
+        buys = ax.scatter([], [], marker="^", color="green", label="Buy Signal", zorder=5)
+        sells = ax.scatter([], [], marker="v", color="red", label="Sell Signal", zorder=5)
+        ax.xaxis_date()
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Deviation (in Std Errors)")
+        ax.legend()
+        ax.grid(True)
+        # Fixed margins instead of running tight_layout for every chart
+        figure.subplots_adjust(left=0.06, right=0.98, top=0.93, bottom=0.09)
+        chart_template.update(figure=figure, ax=ax, line=line, buys=buys, sells=sells, title=ax.set_title(""))
+    return chart_template
+
+# Function to hash the data a spread chart is drawn from, so unchanged charts can be skipped
+def chart_content_hash(task, dates, deviation):
+    digest = hashlib.sha1(f"{task['stock1_name']}|{task['stock2_name']}|{SIGNAL_THRESHOLD}".encode())
+    digest.update(np.ascontiguousarray(dates.view(np.int64)).tobytes())
+    digest.update(np.ascontiguousarray(deviation).tobytes())
+    return digest.hexdigest()
+
+# Function to draw the spread chart for one pair unless its content hash is unchanged; safe to run in a worker process
+def render_chart(task):
+    deviation = pair_worker_state["deviation"][:, task["index"]]
+    valid = ~np.isnan(deviation)
+    dates = pair_worker_state["dates"][valid]
+    deviation = deviation[valid]
+    content_hash = chart_content_hash(task, dates, deviation)
+    if content_hash == task["previous_hash"]:
+        return task["plot_path"], content_hash, False
+    template = get_chart_template()
+    import matplotlib.dates as mdates
+    x = mdates.date2num(dates)
+    template["line"].set_data(x, deviation)
+    buy = deviation < -SIGNAL_THRESHOLD
+    sell = deviation > SIGNAL_THRESHOLD
+    template["buys"].set_offsets(np.column_stack([x[buy], deviation[buy]]))
+    template["sells"].set_offsets(np.column_stack([x[sell], deviation[sell]]))
+    template["title"].set_text(f"Deviation from Std Error: {task['stock2_name']} vs {task['stock1_name']}")
+    template["ax"].relim()
+    template["ax"].autoscale_view()
+    template["figure"].savefig(task["plot_path"])
+    return task["plot_path"], content_hash, True
+
+# Function to run a per-pair stage function for every task, across worker processes when workers > 1.
+# Results come back in task order so the merged output is deterministic.
+def run_pair_stage(function, tasks, panel, deviation, save_dir, workers):
+    if workers <= 1 or len(tasks) <= 1:
+        set_pair_worker_state(panel.dates, panel.prices, deviation, save_dir)
+        return [function(task) for task in tasks]
+    if panel.directory is None:
+        panel.save(save_dir)
+        panel.directory = save_dir
+    # A deviation matrix memory-mapped from its own .npy file is shared as is; anything else is saved for the workers
+    deviation_path = getattr(deviation, "filename", None)
+    temporary = not (deviation_path and np.load(deviation_path, mmap_mode="r").shape == deviation.shape)
+    if temporary:
+        deviation_path = os.path.join(save_dir, "deviation.npy")
+        np.save(deviation_path, deviation)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_pair_worker,
+            initargs=(panel.directory, deviation_path, save_dir, debug_dump["path"], logging.getLogger().level)
+        ) as executor:
+            return list(executor.map(function, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    finally:
+        if temporary:
+            os.remove(deviation_path)
+
+# Function to draw the selected spread charts, skipping pairs whose chart content has not changed since the last run
+def render_charts(tasks, panel, deviation, save_dir, workers, mode):
+    if mode == "none":
+        return []
+    manifest_path = f"{save_dir}/render_manifest.json"
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    render_tasks = []
+    for task in tasks:
+        column = deviation[:, task["index"]]
+        column = column[~np.isnan(column)]
+        if not len(column):
+            continue
+        if mode == "signals" and abs(column[-1]) <= SIGNAL_THRESHOLD:
+            continue
+        if mode == "cointegrated" and not task["adf_p_value"] < 0.05:
             continue
-        logger.info(df.tail(20).to_string())
-        X = sm.add_constant(df[stock1["column"]])
-        model = sm.OLS(df[stock2["column"]], X).fit()
-        logger.info(model.summary().as_text())
-        df["predicted"] = model.predict(X)
-        df["residuals"] = df[stock2["column"]] - df["predicted"]
-        SSE = np.sum(df["residuals"]**2)
-        n, k = len(df), X.shape[1]
-        standard_error = np.sqrt(SSE / (n - k))
-        logger.info(f"Standard Error: {standard_error}")
-        adf_result = adfuller(df["residuals"].dropna())
-        adf_p_value = adf_result[1]
-        logger.info(f"ADF Statistic: {adf_result[0]}, p-value: {adf_p_value}")
-        df["deviation_from_std_error"] = df["residuals"] / standard_error
-        df["signal"] = None
-        df.loc[df["deviation_from_std_error"] < -1.5, "signal"] = f"BUY {stock2['name']}, SELL {stock1['name']}"
-        df.loc[df["deviation_from_std_error"] > 1.5, "signal"] = f"SELL {stock2['name']}, BUY {stock1['name']}"
-        plot_df = df[["deviation_from_std_error", "signal"]].copy()
-        plot_df["date"] = plot_df.index
-        csv_path = f"{save_dir}/data_{stock1['name']}_{stock2['name']}.csv"
-        plot_df.to_csv(csv_path, index=False)
-        upload_to_drive(f"data_{stock1['name']}_{stock2['name']}.csv", csv_path, folder_id)
-        logger.info(f"Saved CSV to {csv_path} and uploaded to Google Drive")
-        signal_df = df[df["signal"].notnull()][["deviation_from_std_error", "signal"]].copy()
-        signal_df["stock1_name"] = stock1["name"]
-        signal_df["stock2_name"] = stock2["name"]
-        signal_df["sector"] = sector
-        signal_df["date"] = signal_df.index
-        signal_df["adf_p_value"] = adf_p_value
-        all_signals.append(signal_df.reset_index(drop=True))
-        logger.info(signal_df.tail(10).to_string())
-        plt.figure(figsize=(14, 6))
-        plt.plot(df.index, df["deviation_from_std_error"], label="Deviation from Std Error", color="blue")
-        plt.axhline(1.5, color="red", linestyle="--", label="+1.5 Std Error")
-        plt.axhline(-1.5, color="green", linestyle="--", label="-1.5 Std Error")
-        plt.axhline(0, color="black", linestyle="-")
-        plt.scatter(
-            df[df["signal"] == f"BUY {stock2['name']}, SELL {stock1['name']}"].index,
-            df[df["signal"] == f"BUY {stock2['name']}, SELL {stock1['name']}"]["deviation_from_std_error"],
-            marker="^", color="green", label="Buy Signal", zorder=5
+        plot_path = f"{save_dir}/spread_{task['stock1_name']}_{task['stock2_name']}.png"
+        previous_hash = manifest.get(os.path.basename(plot_path)) if os.path.exists(plot_path) else None
+        render_tasks.append(dict(task, plot_path=plot_path, previous_hash=previous_hash))
+    rendered = 0
+    plot_paths = []
+    for plot_path, content_hash, changed in run_pair_stage(render_chart, render_tasks, panel, deviation, save_dir, workers):
+        manifest[os.path.basename(plot_path)] = content_hash
+        plot_paths.append(plot_path)
+        if changed:
+            rendered += 1
+            logger.info(f"Saved plot to {plot_path}")
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    run_metrics.count("charts_rendered", rendered)
+    run_metrics.count("charts_unchanged", len(render_tasks) - rendered)
+    logger.info(f"Rendered {rendered} of {len(render_tasks)} selected charts, {len(render_tasks) - rendered} unchanged")
+    return plot_paths
+
+# Function to build the per-pair tasks of the analysis and render stages from the fitted hedge and ADF results
+def build_pair_tasks(registry, pairs, hedge, adf):
+    sectors = registry.sectors(pairs.left)
+    return [
+        {
+            "index": j,
+            "stock1_index": int(pairs.left[j]),
+            "stock2_index": int(pairs.right[j]),
+            "stock1_name": registry.names[pairs.left[j]],
+            "stock2_name": registry.names[pairs.right[j]],
+            "sector": sectors[j],
+            "intercept": hedge["intercept"][j],
+            "beta": hedge["beta"][j],
+            "std_error": hedge["std_error"][j],
+            "adf_stat": adf["adf_stat"][j],
+            "adf_p_value": adf["p_value"][j],
+        }
+        for j in range(len(pairs))
+    ]
+
+# Function to parse a comma-separated list of numbers from the command line
+def float_list(value):
+    return [float(item) for item in value.split(",") if item.strip()]
+
+# Function to parse command line options
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate pair trading signals from Zerodha Kite data")
+    parser.add_argument("command", nargs="?", choices=["all", "fetch", "analyze", "render", "publish"], default="all",
+                        help="Run one step on the output of the previous one, or all of them (default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes for the per-pair analysis (default: CPU count)")
+    parser.add_argument("--hedge", choices=["static", "rolling", "kalman"], default="static",
+                        help="Hedge ratio model: one regression over the whole window, a look-ahead-free "
+                             "rolling regression over the last --window bars, or a Kalman filter")
+    parser.add_argument("--window", type=int, default=60,
+                        help="Number of bars in the rolling regression window (default: 60)")
+    parser.add_argument("--min-periods", type=int,
+                        help="Valid bars a rolling window needs before it gives a hedge ratio; lower it so a missing "
+                             "bar does not blank the next --window deviations (default: --window)")
+    parser.add_argument("--backtest", action="store_true",
+                        help="Backtest the deviation signals and write backtest_pairs.csv and backtest_sectors.csv")
+    parser.add_argument("--entry-z", type=float, default=SIGNAL_THRESHOLD,
+                        help=f"Backtest entry threshold in standard errors (default: {SIGNAL_THRESHOLD})")
+    parser.add_argument("--exit-z", type=float, default=0.0,
+                        help="Backtest exit once the deviation is back within this distance of the mean (default: 0)")
+    parser.add_argument("--stop-z", type=float, default=4.0,
+                        help="Backtest stop-loss threshold in standard errors (default: 4)")
+    parser.add_argument("--cost-bps", type=float, default=5.0,
+                        help="Backtest cost per unit of notional traded, in basis points (default: 5)")
+    parser.add_argument("--days", type=int, default=367,
+                        help="Calendar days of history to fetch and fit on (default: 367)")
+    parser.add_argument("--interval", choices=list(KITE_MAX_DAYS_PER_REQUEST), default="day",
+                        help="Bar interval; intraday history is fetched in chunks of the range Kite allows per request")
+    parser.add_argument("--sweep", action="store_true",
+                        help="Grid-search lookbacks and thresholds, write sweep_results.csv and skip the signal run")
+    parser.add_argument("--sweep-lookbacks", type=float_list, default=[120.0, 250.0, 367.0],
+                        help="Comma-separated lookbacks in calendar days for --sweep (default: 120,250,367)")
+    parser.add_argument("--sweep-entry", type=float_list, default=[1.0, 1.5, 2.0, 2.5],
+                        help="Comma-separated entry thresholds for --sweep (default: 1,1.5,2,2.5)")
+    parser.add_argument("--sweep-exit", type=float_list, default=[0.0, 0.5],
+                        help="Comma-separated exit thresholds for --sweep (default: 0,0.5)")
+    parser.add_argument("--sweep-stop", type=float_list, default=[3.0, 4.0],
+                        help="Comma-separated stop-loss thresholds for --sweep (default: 3,4)")
+    parser.add_argument("--discover", action="store_true",
+                        help="Build the pair list from the sectors of the instrument universe instead of pairs.csv")
+    parser.add_argument("--min-correlation", type=float, default=0.5,
+                        help="Pair discovery: minimum correlation of daily log returns (default: 0.5)")
+    parser.add_argument("--max-half-life", type=float, default=60.0,
+                        help="Pair discovery: maximum spread mean-reversion half-life in bars (default: 60)")
+    parser.add_argument("--max-p-value", type=float, default=0.05,
+                        help="Pair discovery: maximum Engle-Granger cointegration p-value (default: 0.05)")
+    parser.add_argument("--kalman-delta", type=float, default=1e-4,
+                        help="Kalman filter state noise; larger values let the hedge ratio adapt faster (default: 1e-4)")
+    parser.add_argument("--live", action="store_true",
+                        help="After fitting, monitor pair deviations tick by tick from the Kite websocket")
+    parser.add_argument("--replay-ticks", metavar="PATH",
+                        help="With --live, replay recorded tick batches from PATH instead of the websocket")
+    parser.add_argument("--replay-speed", type=float, default=0.0,
+                        help="Pacing of --replay-ticks and --replay-dir relative to the recording; "
+                             "0 replays as fast as possible (default: 0)")
+    parser.add_argument("--replay-dir", metavar="DIR",
+                        help="Run offline: serve historical bars from a --record-dir recording, ending the window at "
+                             "the recording time, and skip the Drive upload and email")
+    parser.add_argument("--record-dir", metavar="DIR",
+                        help="Record every historical data response into DIR for later --replay-dir runs")
+    parser.add_argument("--record-ticks", metavar="PATH",
+                        help="With --live, append every received tick batch to PATH for later replay")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="INFO",
+                        help="Console log level; WARNING keeps only warnings and errors (default: INFO)")
+    parser.add_argument("--debug-dump", metavar="PATH",
+                        help="Write the per-pair price and signal tables to PATH (off by default, as they are costly)")
+    parser.add_argument("--profile", choices=["cprofile", "pyinstrument"],
+                        help="Profile the run's main thread and save profile.pstats (cProfile) or profile.html "
+                             "(pyinstrument sampling profiler, if installed) to the output directory")
+    parser.add_argument("--universe", default=UNIVERSE_DIR,
+                        help="Directory holding instruments.csv and pairs.csv")
+    parser.add_argument("--corporate-actions", metavar="PATH",
+                        help="CSV of name, ex_date, factor used to back-adjust closes before each ex-date "
+                             "(default: corporate_actions.csv in the --universe directory)")
+    parser.add_argument("--jump-threshold", type=float, default=PRICE_JUMP_THRESHOLD,
+                        help="Close-to-close move, as a fraction, reported as a price discontinuity when no "
+                             f"corporate action explains it (default: {PRICE_JUMP_THRESHOLD})")
+    parser.add_argument("--price-jumps", choices=["truncate", "keep"], default="truncate",
+                        help="Drop each instrument's history before its last unexplained discontinuity, "
+                             "or keep it and only report it (default: truncate)")
+    parser.add_argument("--output-dir", default="/tmp/test_results",
+                        help="Directory for CSV files, charts and the chart render manifest")
+    parser.add_argument("--render", choices=["all", "signals", "cointegrated", "none"], default="all",
+                        help="Which spread charts to draw: all pairs, pairs with a signal on the latest bar, "
+                             "pairs with ADF p-value below 0.05, or none")
+    return parser.parse_args(argv)
+
+# Function to load the state that the fetch/analyze/render/publish commands hand to each other through save_dir
+def load_run_state(save_dir):
+    path = os.path.join(save_dir, "run_state.json")
+    if not os.path.exists(path):
+        return {"as_of": None, "offline": False, "stale": False, "uploads": [], "signals_csv": None}
+    with open(path) as f:
+        return json.load(f)
+
+def save_run_state(save_dir, state):
+    with open(os.path.join(save_dir, "run_state.json"), "w") as f:
+        json.dump(state, f, indent=2)
+
+# Function to run the fetch command: fetch the price panel of the universe, live, recorded or replayed
+def fetch_stage(args, registry, state):
+    as_of = None
+    if args.replay_dir:
+        replay = ReplayKite(args.replay_dir, args.replay_speed)
+        clients["kite"] = replay
+        as_of = replay.recorded_until
+        logger.info(f"Replaying historical data recorded until {as_of} from {args.replay_dir}")
+    elif args.record_dir:
+        clients["kite"] = RecordingKite(get_kite(), args.record_dir)
+    state.update(as_of=as_of and as_of.isoformat(), offline=bool(args.replay_dir))
+    # Recording and replay bypass the OHLC cache so the whole window goes through the recorded requests
+    cache_dir = None if args.replay_dir or args.record_dir else OHLC_CACHE_DIR
+    days = int(max(args.sweep_lookbacks)) if args.sweep else args.days
+    with run_metrics.stage("fetch"):
+        panel = fetch_price_panel(registry, interval=args.interval, days=days, cache_dir=cache_dir, as_of=as_of)
+    counters = run_metrics.report()["counters"]
+    # Publishing is refused when no instrument got fresh bars, so yesterday's signals are not sent out again
+    state["stale"] = 0 < counters.get("instruments_fetched", 0) == counters.get("instruments_stale", 0)
+    return panel
+
+# Function to align the fetched panel for corporate actions and price jumps and write the coverage report
+def align_stage(args, registry, panel, state):
+    # Only the default file in the universe directory may be absent; an explicit path must exist
+    actions = load_corporate_actions(
+        args.corporate_actions or os.path.join(args.universe, "corporate_actions.csv"), registry,
+        required=bool(args.corporate_actions)
+    )
+    with run_metrics.stage("align"):
+        panel, report = align_price_panel(
+            panel, registry, actions, jump_threshold=args.jump_threshold, truncate_jumps=args.price_jumps == "truncate"
+        )
+        coverage_csv_path = f"{args.output_dir}/price_coverage.csv"
+        report.to_csv(coverage_csv_path, index=False)
+    state["uploads"].append(coverage_csv_path)
+    return panel
+
+# Function to run the analyze command: fit every pair, write the signal store and signal CSVs (or run the sweep
+# or live monitor instead). Returns the fitted analysis for the render command, or None when there is nothing to draw.
+def analyze_stage(args, registry, pairs, panel, state):
+    save_dir = args.output_dir
+    periods_per_year = 252 * BARS_PER_DAY[args.interval]
+    prices = panel.prices
+    if args.discover:
+        with run_metrics.stage("discover"):
+            pairs, discovery = discover_pairs(
+                prices, registry,
+                min_correlation=args.min_correlation, max_half_life=args.max_half_life, max_p_value=args.max_p_value
+            )
+            discovered_csv_path = f"{save_dir}/discovered_pairs.csv"
+            pd.DataFrame({
+                "stock1_name": registry.names[pairs.left], "stock2_name": registry.names[pairs.right],
+                "sector": registry.sectors(pairs.left), **discovery,
+            }).to_csv(discovered_csv_path, index=False)
+        state["uploads"].append(discovered_csv_path)
+        logger.info(f"Discovered {len(pairs)} pairs, saved to {discovered_csv_path}")
+    has_data = ~np.isnan(prices).all(axis=0)
+    usable = has_data[pairs.left] & has_data[pairs.right]
+    for k in np.flatnonzero(~usable):
+        logger.warning(f"Skipping pair {registry.names[pairs.left[k]]} - {registry.names[pairs.right[k]]} due to missing data")
+    run_metrics.count("pairs_skipped", int((~usable).sum()))
+    pairs = pairs.subset(usable)
+    run_metrics.count("pairs_processed", len(pairs))
+    if args.sweep:
+        with run_metrics.stage("sweep"):
+            results = run_sweep(
+                panel, pairs, registry, [int(days) for days in args.sweep_lookbacks],
+                args.sweep_entry, args.sweep_exit, args.sweep_stop, args.cost_bps, args.workers, save_dir,
+                periods_per_year
+            )
+            sweep_csv_path = f"{save_dir}/sweep_results.csv"
+            results.to_csv(sweep_csv_path, index=False)
+        state["uploads"].append(sweep_csv_path)
+        logger.info(f"Sweep results for {len(results)} sector/parameter combinations saved to {sweep_csv_path}")
+        return None
+    sectors = registry.sectors(pairs.left)
+    # (bars x pairs) results are memory-mapped files in save_dir, filled one batch of pairs or rows at a time
+    shape = (prices.shape[0], len(pairs))
+    deviation = result_arrays(save_dir, "hedge", ["deviation"], shape)["deviation"] if args.hedge == "static" else None
+    adf_lags = {"maxlag": int(ADF_FIXED_LAG), "autolag": None} if ADF_FIXED_LAG else {}
+    regression, adf = fit_static_hedge(prices, pairs.left, pairs.right, deviation, **adf_lags)
+    hedge = regression
+    beta_path = regression["beta"]
+    with run_metrics.stage("hedge"):
+        if args.hedge in ("rolling", "kalman"):
+            if args.hedge == "rolling":
+                dynamic = incremental_rolling_ols(
+                    panel, pairs.left, pairs.right, args.window, args.min_periods,
+                    state_path=os.path.join(save_dir, "rolling_state.npz")
+                )
+            else:
+                dynamic = chunked_kalman_hedge(
+                    prices, pairs.left, pairs.right, delta=args.kalman_delta,
+                    out=result_arrays(save_dir, "hedge", ["intercept", "beta", "std_error", "deviation"], shape)
+                )
+            deviation = dynamic["deviation"]
+            beta_path = dynamic["beta"]
+            # Report the hedge currently in force, i.e. the estimate on the latest bar
+            hedge = {key: last_valid(dynamic[key]) for key in ("intercept", "beta", "std_error")}
+    if args.live:
+        monitor = LiveSpreadMonitor(
+            registry, pairs, hedge, last_valid(prices), alert_path=f"{save_dir}/live_alerts.jsonl",
+            record_path=args.record_ticks
+        )
+        try:
+            with run_metrics.stage("live"):
+                if args.replay_ticks:
+                    replay_ticks(args.replay_ticks, monitor, args.replay_speed)
+                else:
+                    run_live_ticker(monitor, registry)
+        except KeyboardInterrupt:
+            logger.info("Live monitor stopped")
+        finally:
+            monitor.close()
+            for name in ("batches", "ticks", "alerts"):
+                run_metrics.count(f"live_{name}", monitor.stats[name])
+        return None
+    analysis = {
+        "left": pairs.left, "right": pairs.right, "deviation": deviation,
+        "intercept": hedge["intercept"], "beta": hedge["beta"], "std_error": hedge["std_error"],
+        "adf_stat": adf["adf_stat"], "adf_p_value": adf["p_value"],
+    }
+    tasks = build_pair_tasks(registry, pairs, hedge, adf)
+    with run_metrics.stage("analyze"):
+        results = run_pair_stage(analyze_pair, tasks, panel, deviation, save_dir, args.workers)
+    all_signals = [signal_df for signal_df in results if signal_df is not None]
+    run_metrics.count("pairs_empty", len(results) - len(all_signals))
+    run_date = datetime.fromisoformat(state["as_of"]) if state["as_of"] else datetime.now()
+    with run_metrics.stage("signal_store"):
+        state["uploads"] += write_signal_store(
+            save_dir, run_date.strftime("%Y-%m-%d"), panel.dates,
+            deviation, beta_path, adf["p_value"], pairs, registry
         )
-        plt.scatter(
-            df[df["signal"] == f"SELL {stock2['name']}, BUY {stock1['name']}"].index,
-            df[df["signal"] == f"SELL {stock2['name']}, BUY {stock1['name']}"]["deviation_from_std_error"],
-            marker="v", color="red", label="Sell Signal", zorder=5
+    if args.backtest and not len(pairs):
+        logger.warning("No pairs left to backtest, skipping the backtest")
+    elif args.backtest:
+        with run_metrics.stage("backtest"):
+            x = prices[:, pairs.left]
+            y = prices[:, pairs.right]
+            pair_results, sector_results = backtest_pairs(
+                deviation, x, y, beta_path, sectors,
+                entry_z=args.entry_z, exit_z=args.exit_z, stop_z=args.stop_z, cost_bps=args.cost_bps,
+                periods_per_year=periods_per_year
+            )
+            pair_results.insert(0, "stock2_name", registry.names[pairs.right])
+            pair_results.insert(0, "stock1_name", registry.names[pairs.left])
+            pair_results["adf_p_value"] = adf["p_value"]
+            for name, results in (("backtest_pairs.csv", pair_results), ("backtest_sectors.csv", sector_results)):
+                results.to_csv(f"{save_dir}/{name}", index=False)
+                state["uploads"].append(f"{save_dir}/{name}")
+        logger.info(
+            f"Backtest: {int(pair_results['trades'].sum())} trades, "
+            f"median pair Sharpe {pair_results['sharpe'].median():.2f}, saved to {save_dir}/backtest_pairs.csv"
         )
-        plt.title(f"Deviation from Std Error: {stock2['name']} vs {stock1['name']}")
-        plt.xlabel("Date")
-        plt.ylabel("Deviation (in Std Errors)")
-        plt.legend()
-        plt.grid(True)
-        plt.tight_layout()
-        plot_path = f"{save_dir}/spread_{stock1['name']}_{stock2['name']}.png"
-        plt.savefig(plot_path)
-        plt.close()
-        upload_to_drive(f"spread_{stock1['name']}_{stock2['name']}.png", plot_path, folder_id)
-        logger.info(f"Saved plot to {plot_path} and uploaded to Google Drive")
+    state["signals_csv"] = None
     if all_signals:
         signals_df = pd.concat(all_signals, ignore_index=True)
         signals_csv_path = f"{save_dir}/pair_trading_signals.csv"
         signals_df.to_csv(signals_csv_path, index=False)
-        upload_to_drive("pair_trading_signals.csv", signals_csv_path, folder_id)
-        logger.info(f"All signals saved to {signals_csv_path} and uploaded to Google Drive")
-        send_email(signals_csv_path)
+        state["uploads"].append(signals_csv_path)
+        state["signals_csv"] = signals_csv_path
+        run_metrics.count("signals", len(signals_df))
+        logger.info(f"All signals saved to {signals_csv_path}")
     else:
         logger.warning("No trading signals generated")
+    return analysis
+
+# Function to run the render command: draw the selected spread charts of an analysis
+def render_stage(args, registry, panel, analysis, state):
+    pairs = PairTable(analysis["left"], analysis["right"])
+    hedge = {key: analysis[key] for key in ("intercept", "beta", "std_error")}
+    adf = {"adf_stat": analysis["adf_stat"], "p_value": analysis["adf_p_value"]}
+    tasks = build_pair_tasks(registry, pairs, hedge, adf)
+    with run_metrics.stage("render"):
+        state["uploads"] += render_charts(tasks, panel, analysis["deviation"], args.output_dir, args.workers, args.render)
+
+# Function to run the publish command: upload the files the other commands produced and email the signals
+def publish_stage(args, state):
+    uploads = list(dict.fromkeys(path for path in state["uploads"] if os.path.exists(path)))
+    if state["offline"] or args.replay_dir:
+        logger.info(f"Offline replay run, skipping upload of {len(uploads)} files and the email")
+        return
+    if state.get("stale"):
+        logger.error(f"Every instrument was served from cache after failed fetches, not publishing {len(uploads)} files")
+        return
+    with run_metrics.stage("upload"):
+        get_drive_uploader(os.environ.get('GOOGLE_DRIVE_FOLDER_ID')).upload_many(uploads)
+    if state["signals_csv"]:
+        with run_metrics.stage("email"):
+            send_email(state["signals_csv"])
+    state.update(uploads=[], signals_csv=None)
+
+# Function to run one command, or the whole pipeline for "all". Standalone commands hand their results to the
+# next one through save_dir: fetch saves the memory-mapped price panel, analyze saves analysis.npz, and every
+# command records the files still to publish in run_state.json.
+def run_pipeline(args):
+    save_dir = args.output_dir
+    command = args.command
+    state = load_run_state(save_dir)
+    if command in ("all", "fetch"):
+        state.update(uploads=[], signals_csv=None)
+    try:
+        if command == "publish":
+            publish_stage(args, state)
+            return
+        registry, pairs = load_universe(args.universe)
+        if command in ("all", "fetch"):
+            align_stage(args, registry, fetch_stage(args, registry, state), state).save(save_dir)
+        if command == "fetch":
+            return
+        panel = PricePanel.load(save_dir)
+        if command in ("all", "analyze"):
+            analysis = analyze_stage(args, registry, pairs, panel, state)
+            if command == "analyze" and analysis is not None:
+                # The deviation matrix is already a file in save_dir; only its name goes into analysis.npz
+                np.savez(
+                    os.path.join(save_dir, "analysis.npz"),
+                    deviation_file=os.path.basename(analysis["deviation"].filename),
+                    **{key: values for key, values in analysis.items() if key != "deviation"}
+                )
+        else:
+            with np.load(os.path.join(save_dir, "analysis.npz")) as data:
+                analysis = {key: data[key] for key in data.files if key != "deviation_file"}
+                deviation_path = os.path.join(save_dir, str(data["deviation_file"]))
+            analysis["deviation"] = np.load(deviation_path, mmap_mode="r")
+        if analysis is not None and command in ("all", "render"):
+            render_stage(args, registry, panel, analysis, state)
+        if command == "all" and not args.live:
+            publish_stage(args, state)
+    finally:
+        save_run_state(save_dir, state)
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.getLogger().setLevel(args.log_level)
+    configure_debug_dump(args.debug_dump)
+    os.makedirs(args.output_dir, exist_ok=True)
+    run_metrics.reset()
+    profiler = start_profiler(args.profile)
+    try:
+        run_pipeline(args)
+    finally:
+        stop_profiler(profiler, args.output_dir)
+        with fetch_metrics_lock:
+            durations = np.array(fetch_metrics['durations'])
+            for name in ('requests', 'retries', 'failures'):
+                run_metrics.count(f"api_{name}", fetch_metrics[name])
+        run_metrics.write(
+            args.output_dir,
+            options=vars(args),
+            api_latency_ms={
+                "mean": round(durations.mean() * 1000, 1), "p95": round(np.percentile(durations, 95) * 1000, 1),
+                "max": round(durations.max() * 1000, 1),
+            } if len(durations) else None,
+        )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,51 @@
+# tests/test_batch_adfuller.py
+# batch_adfuller against statsmodels adfuller, series by series, with AIC lag search and with a fixed lag
+import os
+import sys
+
+import numpy as np
+from statsmodels.tsa.stattools import adfuller
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import batch_adfuller
+
+
+def mixed_series():
+    rng = np.random.default_rng(0)
+    series = []
+    # Stationary, near unit root and random walk series of a few different lengths
+    for length, phi in [(250, 0.5), (250, 0.95), (250, 1.0), (180, 0.7), (180, 1.0), (90, 0.3), (60, 0.9)]:
+        shocks = rng.normal(0, 1, length)
+        values = np.zeros(length)
+        for t in range(1, length):
+            values[t] = phi * values[t - 1] + shocks[t]
+        series.append(values)
+    return series
+
+
+def assert_matches_adfuller(result, series, **options):
+    for j, values in enumerate(series):
+        stat, p_value, used_lag, nobs = adfuller(values, regression="c", result_object=False, **options)[:4]
+        np.testing.assert_allclose(result["adf_stat"][j], stat, rtol=1e-8)
+        np.testing.assert_allclose(result["p_value"][j], p_value, rtol=1e-8, atol=1e-12)
+        assert result["used_lag"][j] == used_lag
+        assert result["nobs"][j] == nobs
+
+
+def test_batch_adfuller_matches_adfuller_with_aic_lag_search():
+    series = mixed_series()
+    assert_matches_adfuller(batch_adfuller(series), series, autolag="AIC")
+
+
+def test_batch_adfuller_matches_adfuller_with_fixed_lag():
+    series = mixed_series()
+    assert_matches_adfuller(batch_adfuller(series, maxlag=3, autolag=None), series, maxlag=3, autolag=None)
+
+
+def test_batch_adfuller_results_do_not_depend_on_batch_size():
+    series = mixed_series()
+    whole = batch_adfuller(series)
+    batched = batch_adfuller(series, batch_bytes=1)
+    for key in whole:
+        np.testing.assert_array_equal(whole[key], batched[key])
@@ -0,0 +1,37 @@
+# tests/test_batch_ols.py
+# batch_ols against the per-pair statsmodels fit it replaced, on legs with leading and interior gaps
+import os
+import sys
+
+import numpy as np
+import statsmodels.api as sm
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import batch_ols
+
+
+def test_batch_ols_matches_per_pair_statsmodels_fit():
+    rng = np.random.default_rng(0)
+    n_bars, n_pairs = 250, 6
+    x = 100 + np.cumsum(rng.normal(0, 1, (n_bars, n_pairs)), axis=0)
+    y = 20 + rng.uniform(0.5, 2.0, n_pairs) * x + rng.normal(0, 2, (n_bars, n_pairs))
+    # Leading gaps (a leg listed late) and interior gaps in either leg
+    x[:30, 1] = np.nan
+    y[:5, 2] = np.nan
+    x[rng.random((n_bars, n_pairs)) < 0.05] = np.nan
+    y[rng.random((n_bars, n_pairs)) < 0.05] = np.nan
+
+    regression = batch_ols(x, y)
+
+    for j in range(n_pairs):
+        valid = ~(np.isnan(x[:, j]) | np.isnan(y[:, j]))
+        model = sm.OLS(y[valid, j], sm.add_constant(x[valid, j])).fit()
+        residuals = y[valid, j] - model.predict(sm.add_constant(x[valid, j]))
+        std_error = np.sqrt(np.sum(residuals ** 2) / (valid.sum() - 2))
+        np.testing.assert_allclose(regression["intercept"][j], model.params[0], rtol=1e-9)
+        np.testing.assert_allclose(regression["beta"][j], model.params[1], rtol=1e-9)
+        np.testing.assert_allclose(regression["std_error"][j], std_error, rtol=1e-9)
+        np.testing.assert_allclose(regression["residuals"][valid, j], residuals, rtol=1e-9, atol=1e-9)
+        assert np.isnan(regression["residuals"][~valid, j]).all()
+        assert regression["nobs"][j] == valid.sum()
@@ -0,0 +1,100 @@
+# tests/test_drive_uploader.py
+# DriveUploader against an in-memory stand-in for the Drive files() service: create, unchanged skip, update, failures
+import hashlib
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import DriveUploader
+
+
+class FakeRequest:
+    def __init__(self, call):
+        self.call = call
+
+    def execute(self, http=None):
+        return self.call()
+
+
+# Keeps the folder's files in a dict keyed by id and records every call made, like the parts of files() we use
+class FakeFiles:
+    def __init__(self, fail_names=()):
+        self.files = {}
+        self.calls = []
+        self.ids = itertools.count()
+        self.fail_names = set(fail_names)
+
+    def list(self, q, fields, pageSize, pageToken=None):
+        self.calls.append("list")
+        listing = [dict(file) for file in self.files.values()]
+        return FakeRequest(lambda: {"files": listing})
+
+    def store(self, file_id, name, media):
+        if name in self.fail_names:
+            raise IOError(f"upload of {name} refused")
+        md5 = hashlib.md5(media.getbytes(0, media.size())).hexdigest()
+        self.files[file_id] = {"id": file_id, "name": name, "md5Checksum": md5}
+        return {"id": file_id, "md5Checksum": md5}
+
+    def create(self, body, media_body, fields):
+        self.calls.append("create")
+        file_id = f"id{next(self.ids)}"
+        return FakeRequest(lambda: self.store(file_id, body["name"], media_body))
+
+    def update(self, fileId, media_body, fields):
+        self.calls.append("update")
+        return FakeRequest(lambda: self.store(fileId, self.files[fileId]["name"], media_body))
+
+
+class FakeService:
+    def __init__(self, **options):
+        self.fake_files = FakeFiles(**options)
+
+    def files(self):
+        return self.fake_files
+
+
+def write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+    return str(path)
+
+
+def test_drive_uploader_creates_skips_and_updates(tmp_path):
+    service = FakeService()
+    paths = [write(tmp_path / "a.csv", "a,1\n"), write(tmp_path / "b.png", "png")]
+
+    uploader = DriveUploader(service, "folder", workers=2)
+    ids = uploader.upload_many(paths)
+    assert sorted(service.fake_files.calls) == ["create", "create", "list"]
+    assert uploader.stats["uploaded"] == 2 and uploader.stats["bytes"] == 7
+    assert {file["name"]: file["id"] for file in service.fake_files.files.values()} == dict(zip(["a.csv", "b.png"], ids))
+
+    # An unchanged rerun only lists the folder once
+    service.fake_files.calls.clear()
+    uploader = DriveUploader(service, "folder", workers=2)
+    assert uploader.upload_many(paths) == ids
+    assert service.fake_files.calls == ["list"]
+    assert uploader.stats == {"uploaded": 0, "skipped": 2, "failed": 0, "bytes": 0}
+
+    # A changed file is updated in place, keeping its id
+    write(tmp_path / "a.csv", "a,2\n")
+    service.fake_files.calls.clear()
+    uploader = DriveUploader(service, "folder", workers=2)
+    assert uploader.upload_many(paths) == ids
+    assert service.fake_files.calls == ["list", "update"]
+    assert uploader.stats == {"uploaded": 1, "skipped": 1, "failed": 0, "bytes": 4}
+    assert len(service.fake_files.files) == 2
+
+
+def test_drive_uploader_counts_failures(tmp_path):
+    service = FakeService(fail_names=["b.png"])
+    paths = [write(tmp_path / "a.csv", "a,1\n"), write(tmp_path / "b.png", "png")]
+
+    uploader = DriveUploader(service, "folder", workers=2)
+    ids = uploader.upload_many(paths)
+    assert ids[0] is not None and ids[1] is None
+    assert uploader.stats == {"uploaded": 1, "skipped": 0, "failed": 1, "bytes": 4}
+    assert [file["name"] for file in service.fake_files.files.values()] == ["a.csv"]